@@ -6,5 +6,17 @@ This package provides tools for real-time topographic analysis using camera inpu
 
 __version__ = "0.1.0"
 
-# Import main application entry point for convenience
-from . import app
+import importlib
+from types import ModuleType
+
+
+def __getattr__(name: str) -> ModuleType:
+    """
+    Loads the main application entry point on first access.
+
+    ``topovision.app`` pulls in the whole GUI stack (Tk, OpenCV, Matplotlib),
+    so it is imported lazily to keep ``import topovision.<subpackage>`` cheap.
+    """
+    if name == "app":
+        return importlib.import_module(".app", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,7 @@ This package provides various strategies for topographic analysis,
 encapsulated within an AnalysisContext for flexible calculation.
 """
 
+from ._kernels import compile_kernels
 from .calculus_module import AnalysisContext
 from .strategies import ArcLengthStrategy, GradientStrategy, VolumeStrategy
 
@@ -13,4 +14,5 @@ __all__ = [
     "GradientStrategy",
     "VolumeStrategy",
     "ArcLengthStrategy",
+    "compile_kernels",
 ]
@@ -0,0 +1,241 @@
+"""
+Compiled numerical kernels shared by the analysis strategies.
+
+Each kernel walks its input once and writes into caller-allocated output
+arrays, so the strategies avoid the full-frame temporaries that chained
+NumPy expressions create. Numba is used when it is installed; otherwise
+equivalent NumPy implementations with the same signatures are provided.
+
+The kernels are compiled lazily, so importing this module never waits on
+the compiler; :func:`compile_kernels` builds them ahead of the first call.
+"""
+
+import math
+from typing import Any, Tuple, cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    from numba import get_num_threads, njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the installed extras
+    NUMBA_AVAILABLE = False
+
+# Parallel reductions only beat NumPy's single-threaded SIMD loop when there
+# is more than one core to spread the rows over.
+PARALLEL_REDUCTIONS = NUMBA_AVAILABLE and get_num_threads() > 1
+
+# Input dtypes compile_kernels() builds the kernels for. Callers convert
+# anything else (and non-contiguous views) before dispatching.
+KERNEL_INPUT_DTYPES = (np.dtype(np.uint8), np.dtype(np.float32), np.dtype(np.float64))
+
+# Cache-line alignment also satisfies the widest (AVX-512) vector loads.
+OUTPUT_ALIGNMENT = 64
+
+
+def aligned_empty(
+    shape: Tuple[int, ...], dtype: Any, align: int = OUTPUT_ALIGNMENT
+) -> NDArray[Any]:
+    """
+    Allocates an uninitialized C-contiguous array whose data starts on an
+    ``align``-byte boundary.
+
+    ``np.empty`` only guarantees 16-byte alignment, which keeps the compiler
+    from using aligned full-width vector stores in the kernels below.
+    """
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    buffer = np.empty(nbytes + align, dtype=np.uint8)
+    offset = -buffer.ctypes.data % align
+    return cast(
+        NDArray[Any], buffer[offset : offset + nbytes].view(dtype).reshape(shape)
+    )
+
+
+def central_difference(
+    z: NDArray[Any], axis: int, z_scale: float, h: float, out: NDArray[np.float32]
+) -> None:
+    """
+    Writes the derivative of ``z`` along ``axis`` into ``out`` with NumPy.
+
+    Uses the same stencil as :func:`grad_fused` (centered differences inside,
+    one-sided at the borders) but computes it with three slice subtractions
+    straight into ``out``, instead of going through ``np.gradient``'s generic
+    N-D code and its float copy of the input.
+    """
+    zt = np.moveaxis(z, axis, -1)
+    ot = np.moveaxis(out, axis, -1)
+    inv_h = np.float32(z_scale / h)
+    np.subtract(zt[..., 2:], zt[..., :-2], out=ot[..., 1:-1], dtype=np.float32)
+    ot[..., 1:-1] *= np.float32(0.5) * inv_h
+    np.subtract(zt[..., 1], zt[..., 0], out=ot[..., 0], dtype=np.float32)
+    np.subtract(zt[..., -1], zt[..., -2], out=ot[..., -1], dtype=np.float32)
+    ot[..., 0] *= inv_h
+    ot[..., -1] *= inv_h
+
+
+def grad_fused_numpy(
+    z: NDArray[Any],
+    z_scale: float,
+    h: float,
+    dzdx: NDArray[np.float32],
+    dzdy: NDArray[np.float32],
+    mag: NDArray[np.float32],
+) -> None:
+    """NumPy implementation of :func:`grad_fused`, used without Numba."""
+    central_difference(z, 1, z_scale, h, dzdx)
+    central_difference(z, 0, z_scale, h, dzdy)
+    np.hypot(dzdx, dzdy, out=mag)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(inline="always")
+    def _store_gradient(
+        dzdx: NDArray[np.float32],
+        dzdy: NDArray[np.float32],
+        mag: NDArray[np.float32],
+        i: int,
+        j: int,
+        gx: float,
+        gy: float,
+    ) -> None:
+        dzdx[i, j] = gx
+        dzdy[i, j] = gy
+        mag[i, j] = math.sqrt(gx * gx + gy * gy)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def grad_fused(
+        z: NDArray[Any],
+        z_scale: float,
+        h: float,
+        dzdx: NDArray[np.float32],
+        dzdy: NDArray[np.float32],
+        mag: NDArray[np.float32],
+    ) -> None:
+        """
+        Computes dz/dx, dz/dy and the gradient magnitude in a single pass.
+
+        ``z`` is read in its native dtype (typically the uint8 grayscale ROI)
+        and each sample is promoted and multiplied by ``z_scale`` on the fly,
+        so no scaled float copy of the input is ever materialized.
+
+        Interior points use centered differences and border points use
+        one-sided differences, matching ``np.gradient`` with ``edge_order=1``.
+        The two border columns of each row are written first so the interior
+        loop has a fixed stencil and no per-element branches or index
+        clamping. ``z`` must be at least 2x2.
+        """
+        ny, nx = z.shape
+        inv_h = z_scale / h
+        inv_2h = 0.5 * inv_h
+        last = nx - 1
+        for i in prange(ny):
+            im = max(i - 1, 0)
+            ip = min(i + 1, ny - 1)
+            # A one-sided step spans one cell instead of two: double the scale.
+            sy = inv_2h * (3 - (ip - im))
+
+            _store_gradient(
+                dzdx,
+                dzdy,
+                mag,
+                i,
+                0,
+                (float(z[i, 1]) - float(z[i, 0])) * inv_h,
+                (float(z[ip, 0]) - float(z[im, 0])) * sy,
+            )
+            _store_gradient(
+                dzdx,
+                dzdy,
+                mag,
+                i,
+                last,
+                (float(z[i, last]) - float(z[i, last - 1])) * inv_h,
+                (float(z[ip, last]) - float(z[im, last])) * sy,
+            )
+            for j in range(1, last):
+                gx = (float(z[i, j + 1]) - float(z[i, j - 1])) * inv_2h
+                gy = (float(z[ip, j]) - float(z[im, j])) * sy
+                dzdx[i, j] = gx
+                dzdy[i, j] = gy
+                mag[i, j] = math.sqrt(gx * gx + gy * gy)
+
+    @njit(parallel=True, cache=True)
+    def sum_u8(z: NDArray[np.uint8]) -> np.uint64:
+        """
+        Sums a uint8 height map with a row-parallel integer reduction.
+
+        Each row is accumulated into its own ``uint64`` partial and the
+        partials are combined by Numba's parallel reduction, so the result is
+        exact and the work scales with the available cores. Strided views
+        (e.g. a region sliced out of a frame) are read in place.
+        """
+        ny, nx = z.shape
+        total = np.uint64(0)
+        for i in prange(ny):
+            row_total = np.uint64(0)
+            for j in range(nx):
+                row_total += z[i, j]
+            total += row_total
+        return total
+
+    @njit(parallel=True, cache=True)
+    def sum_frames_u8(frames: NDArray[np.uint8], out: NDArray[np.uint64]) -> None:
+        """
+        Sums every frame of an ``(N, H, W)`` uint8 stack into ``out[k]``.
+
+        Frames are distributed across threads and each one is reduced with an
+        integer accumulator, so no widened copy of the stack is created.
+        """
+        n, ny, nx = frames.shape
+        for k in prange(n):
+            total = np.uint64(0)
+            for i in range(ny):
+                for j in range(nx):
+                    total += frames[k, i, j]
+            out[k] = total
+
+    # Argument types the strategies call each kernel with
+    _KERNEL_SIGNATURES = [
+        (
+            grad_fused,
+            [
+                f"void({dtype}[:, ::1], float64, float64, "
+                "float32[:, ::1], float32[:, ::1], float32[:, ::1])"
+                for dtype in ("uint8", "float32", "float64")
+            ],
+        ),
+        (sum_u8, ["uint64(uint8[:, ::1])", "uint64(uint8[:, :])"]),
+        (sum_frames_u8, ["void(uint8[:, :, ::1], uint64[::1])"]),
+    ]
+
+else:  # pragma: no cover - depends on the installed extras
+
+    grad_fused = grad_fused_numpy
+
+    def sum_u8(z: NDArray[np.uint8]) -> np.uint64:
+        """NumPy fallback for :func:`sum_u8`."""
+        return np.uint64(np.add.reduce(z, axis=None, dtype=np.uint64))
+
+    def sum_frames_u8(frames: NDArray[np.uint8], out: NDArray[np.uint64]) -> None:
+        """NumPy fallback for :func:`sum_frames_u8`."""
+        np.add.reduce(frames.reshape(frames.shape[0], -1), axis=1, out=out)
+
+    _KERNEL_SIGNATURES = []
+
+
+def compile_kernels() -> None:
+    """
+    Compiles every kernel for the argument types the strategies pass, or
+    loads them from Numba's on-disk cache.
+
+    Meant to run on a background thread after start-up, so neither the
+    import nor the first analysis waits on the compiler. A call that arrives
+    first simply compiles its own types on demand.
+    """
+    for kernel, signatures in _KERNEL_SIGNATURES:
+        for signature in signatures:
+            kernel.compile(signature)
@@ -4,7 +4,7 @@ IAnalysisStrategy interface. Each strategy encapsulates a specific
 topographic calculation method.
 """
 
-from typing import Any, List, Tuple, Union, cast
+from typing import Any, List
 
 import numpy as np
 from numpy.typing import NDArray
@@ -14,6 +14,15 @@ from topovision.core.models import ArcLengthResult, GradientResult, VolumeResult
 from topovision.utils.math import calculate_arc_length
 from topovision.utils.units import UnitConverter
 
+from ._kernels import (
+    KERNEL_INPUT_DTYPES,
+    PARALLEL_REDUCTIONS,
+    aligned_empty,
+    grad_fused,
+    sum_frames_u8,
+    sum_u8,
+)
+
 
 class GradientStrategy(IAnalysisStrategy):
     """
@@ -27,21 +36,53 @@ class GradientStrategy(IAnalysisStrategy):
         if data.ndim != 2:
             raise ValueError("GradientStrategy expects 2D data.")
 
-        pixels_per_meter = kwargs.get("pixels_per_meter", 1.0)
-        z_factor = kwargs.get("z_factor", 1.0)
+        return self.analyze_batch(data[np.newaxis], **kwargs)[0]
 
-        # The distance between pixels in meters
-        dx = 1.0 / pixels_per_meter
-        dy = 1.0 / pixels_per_meter
+    def analyze_batch(
+        self, frames: NDArray[np.uint8], **kwargs: Any
+    ) -> List[GradientResult]:
+        """
+        Computes the gradient of every frame in an ``(N, H, W)`` stack.
 
-        # Scale the height data
-        scaled_data = data.astype(np.float32) * z_factor
+        The outputs for the whole stack are allocated once and each frame's
+        results are views into them, so the per-call allocation and dispatch
+        overhead is paid once per batch rather than once per frame.
+        """
+        if frames.ndim != 3:
+            raise ValueError("GradientStrategy.analyze_batch expects 3D data.")
 
-        # np.gradient computes the gradient using the provided spacing
-        dz_dy, dz_dx = np.gradient(scaled_data, dy, dx)
-        magnitude = np.sqrt(dz_dx**2 + dz_dy**2)
+        pixels_per_meter = kwargs.get("pixels_per_meter", 1.0)
+        z_factor = kwargs.get("z_factor", 1.0)
 
-        return GradientResult(dz_dx=dz_dx, dz_dy=dz_dy, magnitude=magnitude)
+        if frames.shape[1] < 2 or frames.shape[2] < 2:
+            raise ValueError("GradientStrategy expects data of at least 2x2.")
+
+        # The distance between pixels in meters (same spacing on both axes)
+        spacing = 1.0 / pixels_per_meter
+
+        # Allocate every output up front; the kernel reads the raw heights,
+        # applies the z-factor on the fly and fills all three in one pass.
+        dz_dx = aligned_empty(frames.shape, np.float32)
+        dz_dy = aligned_empty(frames.shape, np.float32)
+        magnitude = aligned_empty(frames.shape, np.float32)
+        heights = np.ascontiguousarray(frames)
+        if heights.dtype not in KERNEL_INPUT_DTYPES:
+            heights = heights.astype(np.float32)
+
+        results = []
+        for k in range(heights.shape[0]):
+            grad_fused(
+                heights[k],
+                float(z_factor),
+                float(spacing),
+                dz_dx[k],
+                dz_dy[k],
+                magnitude[k],
+            )
+            results.append(
+                GradientResult(dz_dx=dz_dx[k], dz_dy=dz_dy[k], magnitude=magnitude[k])
+            )
+        return results
 
 
 class VolumeStrategy(IAnalysisStrategy):
@@ -56,18 +97,49 @@ class VolumeStrategy(IAnalysisStrategy):
         if data.ndim != 2:
             raise ValueError("VolumeStrategy expects 2D data.")
 
+        # Total volume is the sum of the heights of all pixels,
+        # each multiplied by the area of one pixel and the z-factor.
+        # The sum is linear, so the scaling is applied once to the total and
+        # the heights are reduced in their own dtype without a float copy.
+        if PARALLEL_REDUCTIONS and data.dtype == np.uint8:
+            height_sum = float(sum_u8(data))
+        elif np.issubdtype(data.dtype, np.unsignedinteger):
+            height_sum = float(np.add.reduce(data, axis=None, dtype=np.uint64))
+        else:
+            height_sum = float(np.add.reduce(data, axis=None, dtype=np.float64))
+        return self._to_result(height_sum, **kwargs)
+
+    def analyze_batch(
+        self, frames: NDArray[np.uint8], **kwargs: Any
+    ) -> List[VolumeResult]:
+        """
+        Computes the volume under every frame of an ``(N, H, W)`` stack.
+
+        uint8 stacks are reduced by a compiled kernel that sums the frames in
+        parallel; other dtypes fall back to a single NumPy reduction.
+        """
+        if frames.ndim != 3:
+            raise ValueError("VolumeStrategy.analyze_batch expects 3D data.")
+
+        if frames.dtype == np.uint8:
+            height_sums = np.empty(frames.shape[0], dtype=np.uint64)
+            sum_frames_u8(np.ascontiguousarray(frames), height_sums)
+        else:
+            height_sums = np.add.reduce(frames, axis=(1, 2), dtype=np.float64)
+        return [
+            self._to_result(float(height_sum), **kwargs) for height_sum in height_sums
+        ]
+
+    @staticmethod
+    def _to_result(height_sum: float, **kwargs: Any) -> VolumeResult:
+        """Scales a raw height sum to a volume in the requested unit."""
         z_factor = kwargs.get("z_factor", 1.0)
         pixels_per_meter = kwargs.get("pixels_per_meter", 1.0)
         unit = kwargs.get("unit", "cubic_meters")
 
         # The area of a single pixel in square meters
         pixel_area_sq_meters = (1.0 / pixels_per_meter) ** 2
-
-        # Total volume is the sum of the heights of all pixels,
-        # each multiplied by the area of one pixel and the z-factor.
-        volume_in_cubic_meters = (
-            np.sum(data.astype(np.float64)) * z_factor * pixel_area_sq_meters
-        )
+        volume_in_cubic_meters = height_sum * (z_factor * pixel_area_sq_meters)
 
         # Convert to the desired output unit
         converter = UnitConverter(pixels_per_meter)
@@ -91,8 +163,11 @@ class ArcLengthStrategy(IAnalysisStrategy):
         z_factor = kwargs.get("z_factor", 1.0)
         unit = kwargs.get("unit", "meters")
 
-        # Cast data to the expected type for path points, assuming it's provided correctly at runtime
-        path_data = cast(Union[NDArray[np.float64], List[Tuple[float, float]]], data)
+        # Convert once up front; calculate_arc_length reuses this array as-is.
+        # float32 points (as the GUI builds them) are kept in single precision.
+        path_points_array: NDArray[np.floating[Any]] = np.asarray(data)
+        if path_points_array.dtype != np.float32:
+            path_points_array = path_points_array.astype(np.float64, copy=False)
 
         # Define the scale for each axis
         scale_x = 1.0 / pixels_per_meter  # meters per pixel
@@ -100,20 +175,13 @@ class ArcLengthStrategy(IAnalysisStrategy):
 
         # The y-values in `data` represent height, so we use scale_z
         length_in_meters = calculate_arc_length(
-            path_data, scale_x=scale_x, scale_y=scale_z
+            path_points_array, scale_x=scale_x, scale_y=scale_z
         )
 
         # Convert to the desired output unit
         converter = UnitConverter(pixels_per_meter)
         converted_length = converter.convert_distance(length_in_meters, "meters", unit)
 
-        # Ensure path_points_array is NDArray[np.float64] for calculation, then convert to np.int32 for ArcLengthResult
-        path_points_array: NDArray[np.float64]
-        if isinstance(path_data, list):
-            path_points_array = np.asarray(path_data, dtype=np.float64)
-        else:
-            path_points_array = path_data
-
         return ArcLengthResult(
             length=converted_length,
             units=unit,
@@ -26,15 +26,29 @@ class ThreadedOpenCVCamera(ICamera):
     in a separate thread to prevent blocking the main application.
     """
 
-    def __init__(self, camera_id: int = 0):
+    PIXEL_FORMATS = ("rgb", "gray")
+
+    def __init__(self, camera_id: int = 0, pixel_format: str = "rgb"):
         """
         Initializes the threaded OpenCV camera.
 
         Args:
             camera_id (int): The ID of the camera to use
                              (e.g., 0 for the default camera).
+            pixel_format (str): "rgb" for (H, W, 3) color frames, or "gray"
+                                for (H, W) luminance frames when only height
+                                data is needed.
         """
+        if pixel_format not in self.PIXEL_FORMATS:
+            raise ValueError(
+                f"Unsupported pixel format '{pixel_format}'. "
+                f"Expected one of {self.PIXEL_FORMATS}."
+            )
         self.camera_id = camera_id
+        self.pixel_format = pixel_format
+        self._color_conversion = (
+            cv2.COLOR_BGR2GRAY if pixel_format == "gray" else cv2.COLOR_BGR2RGB
+        )
         self.cap: Optional[cv2.VideoCapture] = None
         self.is_running = False
         self.frame_lock = threading.Lock()
@@ -51,6 +65,11 @@ class ThreadedOpenCVCamera(ICamera):
         if not self.cap.isOpened():
             self.cap = None
             raise IOError(f"Cannot open camera {self.camera_id}")
+        # Keep only the newest frame in the driver so reads are never stale.
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # Compressed frames need far less USB bandwidth than raw YUYV; drivers
+        # that do not support MJPG simply ignore the request.
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter.fourcc(*"MJPG"))
 
         self.is_running = True
         self.stop_event.clear()
@@ -70,14 +89,16 @@ class ThreadedOpenCVCamera(ICamera):
             if ret:
                 timestamp = time.time()
                 frame_number += 1
+                # Convert color space once, right after capture, outside the
+                # lock so get_frame() never waits on the conversion.
+                image = cast(
+                    NDArray[np.uint8], cv2.cvtColor(frame, self._color_conversion)
+                )
+                latest = FrameData(
+                    image=image, timestamp=timestamp, frame_number=frame_number
+                )
                 with self.frame_lock:
-                    # Convert color space once, right after capture
-                    rgb_frame = cast(
-                        NDArray[np.uint8], cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    )
-                    self.latest_frame = FrameData(
-                        image=rgb_frame, timestamp=timestamp, frame_number=frame_number
-                    )
+                    self.latest_frame = latest
             else:
                 logging.warning("Failed to grab frame from camera.")
                 time.sleep(0.1)  # Wait a bit before retrying
@@ -127,6 +148,8 @@ class MockCamera(ICamera):
     with configurable patterns.
     """
 
+    FRAME_RING_SIZE = 4
+
     def __init__(
         self, width: int = 640, height: int = 480, pattern: str = "checkerboard"
     ):
@@ -136,6 +159,14 @@ class MockCamera(ICamera):
         self.is_running = False
         self._frame_counter = 0
         self._frame_rate = 30
+        # Patterns are drawn into a small ring of preallocated buffers instead
+        # of a fresh array per frame. Frames are handed out as read-only views
+        # that stay valid for FRAME_RING_SIZE - 1 further frames, which
+        # outlives the controller's double buffer; copy a frame to keep it.
+        self._frame_buffers: NDArray[np.uint8] = np.zeros(
+            (self.FRAME_RING_SIZE, self.height, self.width, 3), dtype=np.uint8
+        )
+        self._frame_buffer: NDArray[np.uint8] = self._frame_buffers[0]
 
     def start(self) -> None:
         self.is_running = True
@@ -157,13 +188,21 @@ class MockCamera(ICamera):
         """
         Fetches the latest captured frame without blocking.
 
+        The image is a read-only view of a ring buffer that is redrawn
+        ``FRAME_RING_SIZE`` frames later; callers that keep it longer must
+        copy it.
+
         Returns:
             The latest FrameData object, or None if no frame is available.
         """
         if not self.is_running:
             return None
 
-        frame = self._generate_mock_frame()
+        self._frame_buffer = self._frame_buffers[
+            self._frame_counter % self.FRAME_RING_SIZE
+        ]
+        frame = self._generate_mock_frame().view()
+        frame.setflags(write=False)
         timestamp = time.time()
         self._frame_counter += 1
 
@@ -182,7 +221,8 @@ class MockCamera(ICamera):
             return self._create_color_change_frame()
 
     def _create_checkerboard_frame(self) -> NDArray[np.uint8]:
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        frame = self._frame_buffer
+        frame.fill(0)
         tile_size = 50
         phase = (self._frame_counter // 15) % 2  # Change pattern every 15 frames
         for y in range(0, self.height, tile_size):
@@ -192,7 +232,8 @@ class MockCamera(ICamera):
         return frame
 
     def _create_gradient_frame(self) -> NDArray[np.uint8]:
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        frame = self._frame_buffer
+        frame[:, :, 2] = 0
         ramp = np.linspace(0, 255, self.width, dtype=np.uint8)
         frame[:, :, 0] = ramp  # Blue gradient
         frame[:, :, 1] = np.roll(
@@ -201,7 +242,8 @@ class MockCamera(ICamera):
         return frame
 
     def _create_color_change_frame(self) -> NDArray[np.uint8]:
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        frame = self._frame_buffer
+        frame.fill(0)
         color_val = (self._frame_counter * 5) % 256
         channel = self._frame_counter % 3
         frame[:, :, channel] = color_val
@@ -95,7 +95,9 @@ class IVisualizer(ABC):
                                                  overlay the visualization.
 
         Returns:
-            Image.Image: The image with the visualization overlaid.
+            Image.Image: The image with the visualization overlaid. It should be
+            an opaque RGB image: the GUI hands it to Tk as RGB and would have
+            to flatten any alpha channel on every display.
         """
         raise NotImplementedError
 
@@ -0,0 +1,68 @@
+"""
+Compiled pixel kernels for the live preview.
+
+Camera frames arrive in RGB order, so the preview only needs a
+nearest-neighbour resize to the canvas. :func:`resize_nearest` writes it
+straight into the caller's buffer with its rows spread over Numba's threads.
+Numba is used when it is installed; otherwise a NumPy implementation with the
+same signature is provided. The kernel is compiled lazily;
+:func:`compile_kernels` builds it ahead of the first frame.
+"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    from numba import get_num_threads, njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the installed extras
+    NUMBA_AVAILABLE = False
+
+# On a single core OpenCV's vectorized resize beats the scalar loop; the
+# kernel only pays off when its rows can be spread over several threads.
+PARALLEL_PREVIEW = NUMBA_AVAILABLE and get_num_threads() > 1
+
+
+def resize_nearest_numpy(src: NDArray[np.uint8], out: NDArray[np.uint8]) -> None:
+    """NumPy implementation of :func:`resize_nearest`, used without Numba."""
+    dst_h, dst_w = out.shape[:2]
+    rows = np.arange(dst_h) * src.shape[0] // dst_h
+    cols = np.arange(dst_w) * src.shape[1] // dst_w
+    np.take(src[rows], cols, axis=1, out=out)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def resize_nearest(src: NDArray[np.uint8], out: NDArray[np.uint8]) -> None:
+        """
+        Resizes an (H, W, C) frame into ``out`` with nearest-neighbour
+        sampling, keeping the channel order.
+
+        ``out`` determines the target size. Source pixels are picked with
+        ``floor(x * src_w / dst_w)``, the same mapping as
+        ``cv2.INTER_NEAREST``.
+        """
+        src_h, src_w = src.shape[0], src.shape[1]
+        dst_h, dst_w = out.shape[0], out.shape[1]
+        channels = src.shape[2]
+        for y in prange(dst_h):
+            sy = y * src_h // dst_h
+            for x in range(dst_w):
+                sx = x * src_w // dst_w
+                for c in range(channels):
+                    out[y, x, c] = src[sy, sx, c]
+
+else:  # pragma: no cover - depends on the installed extras
+
+    resize_nearest = resize_nearest_numpy
+
+
+def compile_kernels() -> None:
+    """
+    Compiles the preview kernel for C-contiguous uint8 frames, or loads it
+    from Numba's on-disk cache. Has no effect when the kernel is not used.
+    """
+    if PARALLEL_PREVIEW:
+        resize_nearest.compile("void(uint8[:, :, ::1], uint8[:, :, ::1])")
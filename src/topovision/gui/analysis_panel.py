@@ -3,12 +3,37 @@ This module defines the AnalysisPanel class, which is a UI component
 for displaying analysis controls in the TopoVision application.
 """
 
+import functools
 import tkinter as tk
 from tkinter import ttk
-from typing import Any, Callable, List
+from typing import Any, Callable, Final, List, Optional
 
 from topovision.gui.i18n import Translator
 
+# Analysis methods offered as buttons, in display order. Each button's label
+# is the "<method>_button" translation key.
+_ANALYSIS_METHODS = ("gradient", "volume", "arc_length")
+
+_STATUS_FONT: Final = ("Segoe UI", 9)
+_ERROR_COLOR: Final = "#FF6B6B"
+_OK_COLOR: Final = "#E6E6E6"
+
+
+def _is_float_prefix(text: str) -> bool:
+    """
+    Tells whether ``text`` is a number, or the start of one, as typed.
+
+    Partial input such as "", "-", "." or "1e" is accepted so the user can
+    keep typing; appending a digit completes every valid prefix.
+    """
+    if "_" in text:
+        return False
+    try:
+        float(text + "0")
+    except ValueError:
+        return False
+    return True
+
 
 class AnalysisPanel(ttk.Frame):
     """
@@ -29,7 +54,7 @@ class AnalysisPanel(ttk.Frame):
     ):
         super().__init__(parent, **kwargs)
         self.analysis_callback = analysis_callback
-        self._ = translator
+        self.set_translator(translator)
         self.available_units = available_units
         self.selected_unit = tk.StringVar(value=self.available_units[0])
         self.scale_update_callback = scale_update_callback
@@ -38,6 +63,19 @@ class AnalysisPanel(ttk.Frame):
         self.show_tutorial_callback = show_tutorial_callback
         self._setup_widgets()
 
+    def set_translator(self, translator: Translator) -> None:
+        """
+        Sets the translator used for the panel's strings, e.g. on a language
+        switch, and refreshes the messages cached from it.
+        """
+        self._ = translator
+
+        # Messages used on every validation or status update
+        self._status_ready_text = self._("status_ready")
+        self._z_factor_error_text = self._("z_factor_error")
+        self._scale_error_text = self._("scale_error")
+        self._calibration_invalid_text = self._("calibration_invalid_dimensions")
+
     def _setup_widgets(self) -> None:
         """Creates and arranges the widgets in the panel using the grid manager."""
         self.columnconfigure(0, weight=1)
@@ -73,8 +111,16 @@ class AnalysisPanel(ttk.Frame):
         frame = ttk.Frame(self)
         frame.grid(row=row, column=0, sticky="ew", padx=10, pady=5)
         ttk.Label(frame, text=self._("z_factor_label")).pack(side=tk.LEFT, padx=(0, 5))
-        self.z_factor_entry = ttk.Entry(frame, width=10)
-        self.z_factor_entry.insert(0, "1.0")
+        # Tk keeps the entry text in a Tcl double, so reading it needs no parse,
+        # and keystrokes that can't lead to a number are rejected as typed.
+        self._z_factor_var = tk.DoubleVar(value=1.0)
+        self.z_factor_entry = ttk.Entry(
+            frame,
+            width=10,
+            textvariable=self._z_factor_var,
+            validate="key",
+            validatecommand=(self.register(_is_float_prefix), "%P"),
+        )
         self.z_factor_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         self.z_factor_entry.bind(
             "<FocusIn>", lambda e: self.show_tutorial_callback("z_factor")
@@ -133,10 +179,17 @@ class AnalysisPanel(ttk.Frame):
         )
         self.calibrate_btn.grid(row=row, column=0, sticky="ew", padx=10, pady=5)
 
+        # The inputs are only needed once calibration starts, so the frame's
+        # contents are built on first show.
         self.calibration_frame = ttk.Frame(self)
         self.calibration_frame.grid(row=row + 1, column=0, sticky="ew", padx=10, pady=5)
         self.calibration_frame.grid_remove()  # Hide by default
+        self._calibration_inputs_built = False
 
+        return row + 2
+
+    def _build_calibration_inputs(self) -> None:
+        """Creates the real-world dimension inputs inside the calibration frame."""
         ttk.Label(self.calibration_frame, text=self._("real_width_label")).grid(
             row=0, column=0, sticky="w"
         )
@@ -158,11 +211,12 @@ class AnalysisPanel(ttk.Frame):
         self.apply_calibration_btn.grid(
             row=2, column=0, columnspan=2, sticky="ew", pady=(10, 0)
         )
-
-        return row + 2
+        self._calibration_inputs_built = True
 
     def show_calibration_inputs(self) -> None:
-        """Shows the calibration input fields."""
+        """Shows the calibration input fields, creating them on first use."""
+        if not self._calibration_inputs_built:
+            self._build_calibration_inputs()
         self.calibration_frame.grid()
 
     def hide_calibration_inputs(self) -> None:
@@ -174,31 +228,26 @@ class AnalysisPanel(ttk.Frame):
             width = float(self.real_width_entry.get())
             height = float(self.real_height_entry.get())
             if width <= 0 or height <= 0:
-                raise ValueError(self._("calibration_invalid_dimensions"))
+                raise ValueError(self._calibration_invalid_text)
             self.apply_calibration_callback(width, height)
         except (ValueError, TypeError):
-            self.set_status(self._("calibration_invalid_dimensions"), is_error=True)
+            self.set_status(self._calibration_invalid_text, is_error=True)
 
     def _create_analysis_buttons(self, row: int) -> int:
         """Creates buttons for triggering different analyses."""
-        btn_config = [
-            ("gradient_button", "gradient"),
-            ("volume_button", "volume"),
-            ("arc_length_button", "arc_length"),
-        ]
-        for i, (text_key, method) in enumerate(btn_config):
-
-            def command_factory(m: str) -> Callable[[], None]:
-                return lambda: self.analysis_callback(m, self.get_selected_unit())
-
+        for i, method in enumerate(_ANALYSIS_METHODS):
             btn = ttk.Button(
                 self,
-                text=self._(text_key),
-                command=command_factory(method),
+                text=self._(f"{method}_button"),
+                command=functools.partial(self._dispatch_analysis, i),
                 style="TButton",
             )
             btn.grid(row=row + i, column=0, sticky="ew", padx=10, pady=2)
-        return row + len(btn_config)
+        return row + len(_ANALYSIS_METHODS)
+
+    def _dispatch_analysis(self, index: int) -> None:
+        """Requests the analysis at ``index`` in the currently selected unit."""
+        self.analysis_callback(_ANALYSIS_METHODS[index], self.get_selected_unit())
 
     def _create_visualization_buttons(self, row: int) -> int:
         """Creates buttons for view and selection control."""
@@ -221,24 +270,26 @@ class AnalysisPanel(ttk.Frame):
 
     def _create_status_label(self) -> None:
         """Creates the label for status messages."""
-        self.status_label_var = tk.StringVar(value=self._("status_ready"))
+        self.status_label_var = tk.StringVar(value=self._status_ready_text)
+        self._current_status_color: Optional[str] = None
+        self._current_status_text = self._status_ready_text
         self.status_label = ttk.Label(
             self,
             textvariable=self.status_label_var,
             wraplength=220,
-            font=("Segoe UI", 9),
+            font=_STATUS_FONT,
             anchor="w",
         )
         self.status_label.grid(row=100, column=0, sticky="ew", padx=10, pady=(15, 5))
 
     def get_z_factor(self) -> float:
         try:
-            z_factor = float(self.z_factor_entry.get())
+            z_factor = self._z_factor_var.get()
             if z_factor <= 0:
                 raise ValueError("Z-factor must be positive.")
             return z_factor
-        except ValueError:
-            raise ValueError(self._("z_factor_error"))
+        except (ValueError, tk.TclError):
+            raise ValueError(self._z_factor_error_text)
 
     def get_scale(self) -> float:
         try:
@@ -247,12 +298,19 @@ class AnalysisPanel(ttk.Frame):
                 raise ValueError("Scale must be positive.")
             return scale
         except ValueError:
-            raise ValueError(self._("scale_error"))
+            raise ValueError(self._scale_error_text)
 
     def get_selected_unit(self) -> str:
         return self.selected_unit.get()
 
     def set_status(self, message: str, is_error: bool = False) -> None:
-        color = "#FF6B6B" if is_error else "#E6E6E6"
-        self.status_label.config(foreground=color)
-        self.status_label_var.set(message)
+        color = _ERROR_COLOR if is_error else _OK_COLOR
+        # Most updates keep the same color; only reconfigure when it changes.
+        if color != self._current_status_color:
+            self.status_label.config(foreground=color)
+            self._current_status_color = color
+        # Repeated messages (e.g. the same hint on every drag) skip the Tcl
+        # variable write and the label redraw it triggers.
+        if message != self._current_status_text:
+            self.status_label_var.set(message)
+            self._current_status_text = message
@@ -5,14 +5,22 @@ This module provides a controller to manage the camera's lifecycle,
 including starting, pausing, and stopping the video feed.
 """
 
-import logging
-from typing import Any, Callable, Optional
+from __future__ import annotations
 
-import numpy as np
-from numpy.typing import NDArray
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
+# ICamera is needed at runtime for the isinstance check in __init__.
 from topovision.core.interfaces import ICamera as ConcreteICamera
-from topovision.core.models import FrameData
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from topovision.core.models import FrameData
+
+logger = logging.getLogger(__name__)
 
 
 class CameraController:
@@ -27,6 +35,10 @@ class CameraController:
         self,
         camera: ConcreteICamera,
         update_callback: Callable[[NDArray[Any]], None],  # Changed to NDArray[Any]
+        min_frame_interval: float = 1 / 60,
+        threaded: bool = False,
+        frame_processor: Optional[Callable[[NDArray[Any]], NDArray[Any]]] = None,
+        error_callback: Optional[Callable[[Exception], None]] = None,
     ):
         """
         Initializes the CameraController.
@@ -35,6 +47,18 @@ class CameraController:
             camera (ConcreteICamera): The camera instance to control.
             update_callback (Callable[[NDArray[Any]], None]): A callback to be invoked
                 with the latest frame for UI updates.
+            min_frame_interval (float): Minimum time in seconds between camera
+                reads; calls within this window reuse the last frame.
+            threaded (bool): If True, frames are read by a background thread
+                into a double buffer, and get_frame() never waits on the camera.
+            frame_processor (Optional[Callable[[NDArray[Any]], NDArray[Any]]]):
+                Applied to each new frame before it is handed out. In threaded
+                mode it runs on the capture thread, keeping e.g. denoising off
+                the UI thread.
+            error_callback (Optional[Callable[[Exception], None]]): Called on
+                the capture thread with the exception that stopped it, so the
+                UI can report the failure. The camera must then be paused or
+                stopped before the next start() launches a fresh thread.
         """
         if not isinstance(camera, ConcreteICamera):
             raise TypeError(
@@ -44,6 +68,23 @@ class CameraController:
         self._update_callback = update_callback
         self._is_running = False
         self._started_once = False
+        self._min_frame_interval = min_frame_interval
+        self._frame_processor = frame_processor
+        self._error_callback = error_callback
+        self._last_frame: Optional[NDArray[Any]] = None
+        self._last_frame_data: Optional[FrameData] = None
+        self._last_frame_time = 0.0
+
+        # Double buffer filled by the capture thread in threaded mode. The
+        # thread writes the back slot, then flips _latest_idx to publish it.
+        self._threaded = threaded
+        self._frame_slots: List[Optional[NDArray[Any]]] = [None, None]
+        self._latest_idx = 0
+        self._slot_lock = threading.Lock()
+        self._capture_thread: Optional[threading.Thread] = None
+        self._stop_capture = threading.Event()
+        self._capture_suspended = False
+        self._capture_error: Optional[Exception] = None
 
     @property
     def is_running(self) -> bool:
@@ -55,6 +96,11 @@ class CameraController:
         """Returns True if the camera has been started at least once."""
         return self._started_once
 
+    @property
+    def capture_error(self) -> Optional[Exception]:
+        """Returns the exception that stopped the capture thread, if any."""
+        return self._capture_error
+
     def start(self) -> None:
         """Starts or resumes the camera feed."""
         if self._is_running:
@@ -64,13 +110,15 @@ class CameraController:
             if not self._started_once:
                 self.camera.start()
                 self._started_once = True
-                logging.info("Camera started for the first time.")
+                logger.info("Camera started for the first time.")
             else:
                 self.camera.resume()
-                logging.info("Camera resumed.")
+                logger.info("Camera resumed.")
             self._is_running = True
+            if self._threaded and not self._capture_suspended:
+                self._start_capture_thread()
         except Exception as e:
-            logging.error(f"Failed to start or resume camera: {e}")
+            logger.error("Failed to start or resume camera: %s", e)
             self._is_running = False
             raise
 
@@ -79,11 +127,14 @@ class CameraController:
             return
 
         try:
+            self._stop_capture_thread()
             self.camera.pause()
             self._is_running = False
-            logging.info("Camera paused.")
+            self._last_frame = None
+            self._last_frame_data = None
+            logger.info("Camera paused.")
         except Exception as e:
-            logging.error(f"Failed to pause camera: {e}")
+            logger.error("Failed to pause camera: %s", e)
             raise
 
     def stop(self) -> None:
@@ -91,17 +142,104 @@ class CameraController:
             return
 
         try:
+            self._stop_capture_thread()
             self.camera.stop()
             self._is_running = False
             self._started_once = False
-            logging.info("Camera stopped.")
+            self._last_frame = None
+            self._last_frame_data = None
+            logger.info("Camera stopped.")
         except Exception as e:
-            logging.error(f"Failed to stop camera: {e}")
+            logger.error("Failed to stop camera: %s", e)
             # Still update state, as the camera might be unusable
             self._is_running = False
             self._started_once = False
             raise
 
+    def set_capture_suspended(self, suspended: bool) -> None:
+        """
+        Stops or restarts the background capture thread without pausing the
+        camera itself, e.g. while the preview is not visible.
+
+        The camera stays open, so resuming is immediate, and :meth:`get_frame`
+        returns None until the thread has published a new frame. Has no
+        effect in non-threaded mode.
+        """
+        if suspended == self._capture_suspended:
+            return
+        self._capture_suspended = suspended
+        if not self._threaded:
+            return
+        if suspended:
+            self._stop_capture_thread()
+            logger.debug("Camera capture suspended.")
+        elif self._is_running:
+            self._start_capture_thread()
+            logger.debug("Camera capture resumed.")
+
+    def _start_capture_thread(self) -> None:
+        """Starts the background thread that feeds the frame double buffer."""
+        if self._capture_thread is not None:
+            return
+        self._stop_capture.clear()
+        self._capture_error = None
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop, name="CameraControllerCapture", daemon=True
+        )
+        self._capture_thread.start()
+
+    def _stop_capture_thread(self) -> None:
+        """Stops the capture thread and drops the buffered frames."""
+        thread = self._capture_thread
+        if thread is None:
+            return
+        self._stop_capture.set()
+        thread.join(timeout=1.0)
+        if thread.is_alive():
+            logger.error("Camera capture thread did not terminate gracefully.")
+        self._capture_thread = None
+        with self._slot_lock:
+            self._frame_slots = [None, None]
+            self._latest_idx = 0
+
+    def _capture_loop(self) -> None:
+        """Reads frames off the UI thread and publishes each new one."""
+        poll_interval = max(self._min_frame_interval, 0.001)
+        last_frame_data: Optional[FrameData] = None
+        try:
+            while not self._stop_capture.is_set():
+                frame_data = self.camera.get_frame()
+                if frame_data is None or frame_data is last_frame_data:
+                    self._stop_capture.wait(poll_interval)
+                    continue
+                last_frame_data = frame_data
+                back_idx = 1 - self._latest_idx
+                frame = self._prepare_frame(frame_data)
+                self._frame_slots[back_idx] = frame
+                with self._slot_lock:
+                    self._latest_idx = back_idx
+        except Exception as e:
+            logger.exception("Camera capture thread failed.")
+            self._capture_error = e
+            if self._error_callback is not None:
+                self._error_callback(e)
+        finally:
+            # Forget the finished thread so the next start() can launch a new one.
+            if self._capture_thread is threading.current_thread():
+                self._capture_thread = None
+
+    def _prepare_frame(self, frame_data: FrameData) -> NDArray[Any]:
+        """
+        Runs the frame processor, if any, and returns the result as a read-only
+        array so callers can share the buffer safely instead of taking
+        defensive copies.
+        """
+        frame = frame_data.image.view()
+        if self._frame_processor is not None:
+            frame = self._frame_processor(frame).view()
+        frame.setflags(write=False)
+        return frame
+
     def toggle(self) -> None:
         """Toggles the camera state between running and paused."""
         if self._is_running:
@@ -111,15 +249,38 @@ class CameraController:
 
     def get_frame(self) -> Optional[NDArray[Any]]:  # Changed to NDArray[Any]
         """
-        Retrieves the latest frame from the camera.
+        Retrieves the latest frame from the camera, reading it at most once
+        per ``min_frame_interval``.
 
         Returns:
-            Optional[NDArray[Any]]: The frame as a NumPy array, or None if no
-            frame is available or the camera is not running.
+            Optional[NDArray[Any]]: A read-only view of the (processed) frame, or
+            None if no frame is available or the camera is not running.
         """
         if not self._is_running:
             return None
+
+        if self._threaded:
+            with self._slot_lock:
+                return self._frame_slots[self._latest_idx]
+
+        # Polling faster than the rate cap just returns the frame already held.
+        now = time.monotonic()
+        if (
+            self._last_frame is not None
+            and now - self._last_frame_time < self._min_frame_interval
+        ):
+            return self._last_frame
+
         frame_data: Optional[FrameData] = self.camera.get_frame()
+        if frame_data is not None and frame_data is self._last_frame_data:
+            # The camera has not produced a new frame; returning the same
+            # object lets callers detect the repeat with an identity check.
+            self._last_frame_time = now
+            return self._last_frame
         if frame_data:
-            return frame_data.image
+            frame = self._prepare_frame(frame_data)
+            self._last_frame = frame
+            self._last_frame_data = frame_data
+            self._last_frame_time = now
+            return frame
         return None
@@ -6,7 +6,7 @@ a rectangular region or four points for calibration.
 """
 
 import tkinter as tk
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple, cast
 
 
 class CanvasPanel(tk.Canvas):
@@ -15,6 +15,8 @@ class CanvasPanel(tk.Canvas):
     """
 
     MIN_SELECTION_SIZE = 10  # Minimum size for a valid selection
+    DRAG_REDRAW_INTERVAL_MS = 16  # Redraw the drag rectangle at most ~60 Hz
+    DRAG_REDRAW_THRESHOLD = 2  # Pixels the corner must move to be redrawn
 
     def __init__(
         self,
@@ -25,10 +27,19 @@ class CanvasPanel(tk.Canvas):
         Initializes the CanvasPanel.
         """
         super().__init__(parent, **kwargs)
+        # Direct Tcl access for the per-frame drag update, skipping the
+        # tkinter wrapper's argument flattening.
+        self._tk_call = self.tk.call
+        self._widget_name = str(self)
 
         self._selection_start: Optional[Tuple[int, int]] = None
         self._selection_rect_id: Optional[int] = None
+        self._selection_visible = False
         self.selected_region: Optional[Tuple[int, int, int, int]] = None
+        # Latest pointer position seen while dragging, drawn on the next flush
+        self._pending_drag: Optional[Tuple[int, int]] = None
+        self._last_drawn_xy: Optional[Tuple[int, int]] = None
+        self._drag_after_id: Optional[str] = None
 
         self.on_selection_made: Optional[Callable[..., None]] = None
         self.on_calibration_point_added: Optional[
@@ -38,10 +49,19 @@ class CanvasPanel(tk.Canvas):
         self.is_calibration_mode = False
         self.calibration_points: List[Tuple[int, int]] = []
 
+        # Current widget size, kept up to date from <Configure> so per-frame
+        # code doesn't need a winfo_width()/winfo_height() round-trip to Tcl.
+        self.canvas_size: Tuple[int, int] = (1, 1)
+
+        self.bind("<Configure>", self._on_configure, add="+")
         self.bind("<ButtonPress-1>", self._on_press)
         self.bind("<B1-Motion>", self._on_drag)
         self.bind("<ButtonRelease-1>", self._on_release)
 
+    def _on_configure(self, event: tk.Event) -> None:  # Removed [Any]
+        """Records the new canvas size after a resize."""
+        self.canvas_size = (event.width, event.height)
+
     def start_calibration(self) -> None:
         """Activates calibration mode, clearing only previous calibration points."""
         self.is_calibration_mode = True
@@ -64,7 +84,42 @@ class CanvasPanel(tk.Canvas):
                     self.on_calibration_point_added(self.calibration_points)
         else:
             self._selection_start = (event.x, event.y)
-            self.delete("selection")
+            self._prepare_selection_rect(event.x, event.y)
+
+    def _prepare_selection_rect(self, x: int, y: int) -> None:
+        """
+        Makes sure the selection rectangle exists, hidden and on top, so that
+        drag updates only need to move it.
+
+        The item is recreated if something else removed it from the canvas.
+        """
+        rect_id = self._selection_rect_id
+        if rect_id is None or not self.type(rect_id):
+            self._selection_rect_id = self.create_rectangle(
+                x,
+                y,
+                x,
+                y,
+                outline="#FFD34D",
+                width=2,
+                # Solid outline: dashed ones are re-tessellated by Tk on every
+                # coords() update during a drag.
+                state="hidden",
+                tags="selection",
+            )
+        else:
+            # Nothing to hide after a clear or a too-small release.
+            if self._selection_visible:
+                self.itemconfigure(rect_id, state="hidden")
+            self.tag_raise(rect_id)
+        self._selection_visible = False
+        self._last_drawn_xy = None
+
+    def _hide_selection_rect(self) -> None:
+        """Hides the selection rectangle without destroying it."""
+        if self._selection_rect_id is not None and self._selection_visible:
+            self.itemconfigure(self._selection_rect_id, state="hidden")
+        self._selection_visible = False
 
     def _draw_calibration_point(self, x: int, y: int) -> None:
         """Draws a visual marker for a calibration point."""
@@ -79,46 +134,111 @@ class CanvasPanel(tk.Canvas):
         )
 
     def _on_drag(self, event: tk.Event) -> None:  # Removed [Any]
-        """Handles dragging to draw a selection rectangle."""
-        if self.is_calibration_mode or not self._selection_start:
+        """
+        Records the drag position and schedules a redraw.
+
+        Motion events can arrive far faster than the screen refreshes, so only
+        the latest position is kept and the rectangle is redrawn at most once
+        per DRAG_REDRAW_INTERVAL_MS.
+        """
+        if self._selection_start is None or self.is_calibration_mode:
             return
 
-        x1, y1 = self._selection_start
-        x2, y2 = event.x, event.y
+        self._pending_drag = (event.x, event.y)
+        if self._drag_after_id is None:
+            self._drag_after_id = self.after(
+                self.DRAG_REDRAW_INTERVAL_MS, self._flush_drag
+            )
 
-        self.delete("selection")
-        self._selection_rect_id = self.create_rectangle(
-            x1, y1, x2, y2, outline="#FFD34D", width=2, dash=(3, 2), tags="selection"
-        )
+    def _cancel_pending_drag(self) -> None:
+        """Cancels a scheduled drag redraw, if any."""
+        if self._drag_after_id is not None:
+            self.after_cancel(self._drag_after_id)
+            self._drag_after_id = None
+
+    def _flush_drag(self) -> None:
+        """
+        Draws the selection rectangle at the latest drag position.
+
+        Moves smaller than DRAG_REDRAW_THRESHOLD pixels on both axes are not
+        visible on screen and are skipped.
+        """
+        self._drag_after_id = None
+        start = self._selection_start
+        pending = self._pending_drag
+        if pending is None or start is None:
+            return
+        self._pending_drag = None
+
+        last = self._last_drawn_xy
+        threshold = self.DRAG_REDRAW_THRESHOLD
+        if (
+            last is not None
+            and abs(pending[0] - last[0]) < threshold
+            and abs(pending[1] - last[1]) < threshold
+        ):
+            return
+        self._last_drawn_xy = pending
+
+        self._draw_selection_rect(start[0], start[1], pending[0], pending[1])
+
+    def _draw_selection_rect(self, x1: int, y1: int, x2: int, y2: int) -> None:
+        """Moves the selection rectangle to the given corners and shows it."""
+        if self._selection_rect_id is None:
+            self._prepare_selection_rect(x1, y1)
+        rect_id = cast(int, self._selection_rect_id)
+        self._tk_call(self._widget_name, "coords", rect_id, x1, y1, x2, y2)
+        if not self._selection_visible:
+            self.itemconfigure(rect_id, state="normal")
+            self._selection_visible = True
 
     def _on_release(self, event: tk.Event) -> None:  # Removed [Any]
         """Finalizes the selection."""
-        if self.is_calibration_mode or not self._selection_start:
+        start = self._selection_start
+        if start is None or self.is_calibration_mode:
             return
 
-        x1, y1 = self._selection_start
+        # Any redraw still waiting to run is replaced by the final one below.
+        self._cancel_pending_drag()
+        self._pending_drag = None
+
+        x1, y1 = start
         x2, y2 = event.x, event.y
         self._selection_start = None
-
-        x1, x2 = min(x1, x2), max(x1, x2)
-        y1, y2 = min(y1, y2), max(y1, y2)
-
-        if (x2 - x1) < self.MIN_SELECTION_SIZE or (y2 - y1) < self.MIN_SELECTION_SIZE:
-            self.delete("selection")
-            if self.on_selection_made:
-                self.on_selection_made(
-                    None, "selection_too_small", min_size=self.MIN_SELECTION_SIZE
-                )
+        on_selection_made = self.on_selection_made
+        min_size = self.MIN_SELECTION_SIZE
+
+        if x2 < x1:
+            x1, x2 = x2, x1
+        if y2 < y1:
+            y1, y2 = y2, y1
+        # Dragging past the edge reports pointer positions outside the canvas;
+        # clamp so the region always indexes inside the displayed frame.
+        width, height = self.canvas_size
+        max_x, max_y = width - 1, height - 1
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(max_x, x2), min(max_y, y2)
+
+        if (x2 - x1) < min_size or (y2 - y1) < min_size:
+            self._hide_selection_rect()
+            if on_selection_made:
+                on_selection_made(None, "selection_too_small", min_size=min_size)
             return
 
-        self.selected_region = (x1, y1, x2, y2)
+        # Draw the clamped region, so the outline matches what is analysed.
+        self._draw_selection_rect(x1, y1, x2, y2)
+        region = (x1, y1, x2, y2)
+        self.selected_region = region
 
-        if self.on_selection_made:
-            self.on_selection_made(self.selected_region, "selection_made")
+        if on_selection_made:
+            on_selection_made(region, "selection_made")
 
     def clear_selection(self) -> None:
         """Clears the current selection rectangle and region data."""
         self.selected_region = None
-        self.delete("selection")
+        self._cancel_pending_drag()
+        self._pending_drag = None
+        # Keep the rectangle item around so the next drag can reuse it.
+        self._hide_selection_rect()
         if self.on_selection_made:
             self.on_selection_made(None, "selection_cleared")
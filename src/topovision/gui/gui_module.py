@@ -3,18 +3,22 @@ This module defines the main window of the TopoVision application,
 which orchestrates the GUI and the core application logic.
 """
 
+import functools
 import json
 import logging
+import math
 import os
+import threading
+import time
 import tkinter as tk
 from tkinter import Tk, messagebox, ttk
-from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, cast
 
 import cv2
 import numpy as np
 from numpy.typing import NDArray
-from PIL import Image, ImageTk
 
+from topovision.calculus import compile_kernels as compile_calculus_kernels
 from topovision.calculus.calculus_module import AnalysisContext
 from topovision.capture.preprocessing import ImagePreprocessor
 from topovision.core.interfaces import ICamera
@@ -25,18 +29,26 @@ from topovision.core.models import (
     RegionOfInterest,
     VolumeResult,
 )
+from topovision.gui._kernels import PARALLEL_PREVIEW
+from topovision.gui._kernels import compile_kernels as compile_preview_kernels
+from topovision.gui._kernels import resize_nearest
 from topovision.gui.analysis_panel import AnalysisPanel
 from topovision.gui.camera_controller import CameraController
 from topovision.gui.canvas_panel import CanvasPanel
-from topovision.gui.plot3d_window import Plot3DWindow
 from topovision.gui.theme import ThemeManager
 from topovision.services.task_queue import TaskQueue
+from topovision.utils.math import compile_kernels as compile_math_kernels
 from topovision.utils.perspective import PerspectiveCorrector
 from topovision.utils.units import UnitConverter
 from topovision.visualization.visualizers import HeatmapVisualizer
 
 from .i18n import get_translator
 
+if TYPE_CHECKING:
+    # Imported on demand: the 3D window pulls in matplotlib's pyplot and Tk
+    # backend, which is most of the GUI's start-up import time.
+    from topovision.gui.plot3d_window import Plot3DWindow
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
@@ -44,10 +56,117 @@ USER_SETTINGS_FILE = os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "user_settings.json"
 )
 
+# cv2 conversions to RGB keyed by channel count. Camera frames and analysis
+# images are both RGB already, so only RGBA and greyscale need converting.
+_RGB_CONVERSIONS = {
+    4: cv2.COLOR_RGBA2RGB,
+    1: cv2.COLOR_GRAY2RGB,
+}
+
+
+def _compile_kernels() -> None:
+    """
+    Builds every Numba kernel ahead of its first use. Runs on a background
+    thread; a failure only means the kernels compile on demand instead.
+    """
+    try:
+        compile_preview_kernels()
+        compile_calculus_kernels()
+        compile_math_kernels()
+    except Exception:
+        logging.exception("Kernel warm-up failed; kernels will compile on use.")
+
+
+def _region_in_frame(
+    region: Tuple[int, int, int, int],
+    frame_shape: Tuple[int, ...],
+    canvas_size: Tuple[int, int],
+) -> Tuple[int, int, int, int]:
+    """
+    Maps a selection in canvas coordinates onto the frame's pixel grid.
+
+    The coordinates are non-negative integers, so exact integer floor division
+    gives the same pixels as truncating the float ratio, without the float
+    round trip or its rounding error.
+    """
+    x1, y1, x2, y2 = region
+    h, w = frame_shape[:2]
+    canvas_w, canvas_h = canvas_size
+    return (
+        x1 * w // canvas_w,
+        y1 * h // canvas_h,
+        x2 * w // canvas_w,
+        y2 * h // canvas_h,
+    )
+
+
+# Result tag of the background job that prepares the 3D surface data
+_PLOT3D_TASK = "plot3d"
+
+
+@functools.lru_cache(maxsize=4)
+def _plot_grid(
+    rows: int, cols: int, real_width: float, real_height: float
+) -> Tuple[NDArray[np.float32], NDArray[np.float32]]:
+    """
+    Returns the single-precision (X, Y) meshgrid of a surface plot of
+    ``rows`` x ``cols`` samples spanning ``real_width`` x ``real_height``.
+
+    The grid only changes with the selection, so it is cached instead of being
+    rebuilt for every frame. The arrays are shared and therefore read-only.
+    """
+    X, Y = np.meshgrid(
+        np.linspace(0, real_width, cols, dtype=np.float32),
+        np.linspace(0, real_height, rows, dtype=np.float32),
+    )
+    X.setflags(write=False)
+    Y.setflags(write=False)
+    return X, Y
+
+
+def _capped_grid_size(rows: int, cols: int, max_points: int) -> Tuple[int, int]:
+    """
+    Shrinks a ``rows`` x ``cols`` grid proportionally so that it holds at most
+    ``max_points`` samples (but keeps at least 2 x 2).
+    """
+    if rows * cols <= max_points:
+        return rows, cols
+    factor = math.sqrt(rows * cols / max_points)
+    return max(2, int(rows / factor)), max(2, int(cols / factor))
+
+
+def _ppm_frame_buffer(w: int, h: int) -> Tuple[bytearray, NDArray[np.uint8]]:
+    """
+    Allocates a binary PPM image of ``w`` x ``h`` pixels.
+
+    Returns the whole file as a bytearray together with an (H, W, 3) array
+    viewing its pixel payload, so pixels written into the array are already
+    laid out as PPM and ``bytes(buffer)`` is all Tk needs.
+    """
+    header = b"P6\n%d %d\n255\n" % (w, h)
+    buffer = bytearray(len(header) + w * h * 3)
+    buffer[: len(header)] = header
+    pixels = np.frombuffer(buffer, dtype=np.uint8, offset=len(header))
+    return buffer, pixels.reshape(h, w, 3)
+
 
 class MainWindow(Tk):
     """The main window of the TopoVision application."""
 
+    # Target period of the live preview loop (~60 fps)
+    FRAME_INTERVAL_MS = 16
+    # Re-check period of the preview loop while the window is minimized
+    HIDDEN_POLL_MS = 100
+    # Live 3D plot updates: maximum rate, the pixel stride of the region
+    # sample used to detect a changed scene, and the mean absolute difference
+    # (in grey levels) below which the sample counts as unchanged
+    PLOT3D_MAX_FPS = 15
+    PLOT3D_SAMPLE_STRIDE = 8
+    PLOT3D_CHANGE_THRESHOLD = 1.0
+    # Default cap on the samples of the 3D surface ("max_3d_points" setting);
+    # larger regions are downscaled before the Z grid is built
+    MAX_3D_POINTS = 128 * 128
+
     def __init__(
         self,
         camera: ICamera,
@@ -73,24 +192,63 @@ class MainWindow(Tk):
         self.unit_converter = UnitConverter(pixels_per_meter=100.0)
         self.perspective_corrector: Optional[PerspectiveCorrector] = None
 
-        self.camera_controller = CameraController(camera, self._update_canvas_image)
-        self.photo: Optional[ImageTk.PhotoImage] = None
-        self._analysis_result_photo: Optional[ImageTk.PhotoImage] = None
+        # Frames are read and denoised on a background thread so a slow or
+        # blocking camera, or the filter itself, never stalls the Tk event loop.
+        self.camera_controller = CameraController(
+            camera,
+            self._update_canvas_image,
+            threaded=True,
+            frame_processor=self.preprocessor.process,
+            error_callback=self._notify_capture_failed,
+        )
+        self.photo: Optional[tk.PhotoImage] = None
+        self._photo_size: Optional[Tuple[int, int]] = None
+        self._analysis_result_photo: Optional[tk.PhotoImage] = None
         self.is_showing_analysis: bool = False
         self.selected_region: Optional[Tuple[int, int, int, int]] = None
         self._last_frame: Optional[NDArray[Any]] = None  # Use NDArray[Any]
         self._canvas_image_id: Optional[int] = None
+        self._displayed_photo: Optional[Any] = None
+        self._idle_text_id: Optional[int] = None
+        # Set while live frames arrive but the analysis view is on screen
+        self._preview_stale = False
+        # The live preview is purely cosmetic, so it uses the cheapest
+        # resampler; set e.g. cv2.INTER_AREA for a smoother downscale.
+        self.preview_interpolation: int = cv2.INTER_NEAREST
+        # Display buffers reused across frames and analysis results
+        self._resized_buf: Optional[NDArray[Any]] = None
+        self._rgb_buf: Optional[NDArray[np.uint8]] = None
+        self._ppm_buf: Optional[bytearray] = None  # PPM file viewed by _rgb_buf
         self.plot3d_window: Optional[Plot3DWindow] = None
+        self._tick_id: Optional[str] = None
+        self._refresh_id: Optional[str] = None
+        self._plot3d_pending = False  # A 3D data job is queued or running
+        self._plot3d_last_request = 0.0
+        # Inputs and region sample of the last 3D data job, to skip repeats
+        self._plot3d_last_input: Optional[Tuple[Tuple[Any, ...], NDArray[Any]]] = None
 
         self.user_settings = self._load_user_settings()
+        self._settings_dirty = False
+        self._settings_flush_id: Optional[str] = None
+        self._closing = False
 
         self._setup_styles()
         self._setup_ui()
 
         self.protocol("WM_DELETE_WINDOW", self._on_exit)
-        self.after(100, self._process_results)
-        self.after(15, self._update_frame)
+        # The worker posts a virtual event per finished task, so results are
+        # handled as soon as they exist and the UI thread never polls.
+        self.bind("<<TaskResult>>", lambda _event: self._process_results())
+        self.task_queue.set_result_listener(self._notify_task_result)
+        self.bind("<<CaptureFailed>>", lambda _event: self._handle_capture_failure())
         self.after(500, lambda: self._show_tutorial_if_first_time("app_start"))
+        # Kernels compile lazily; build them once the window is up so neither
+        # start-up nor the first frame or analysis waits on the compiler.
+        self.after_idle(
+            lambda: threading.Thread(
+                target=_compile_kernels, name="KernelWarmup", daemon=True
+            ).start()
+        )
 
     def _load_user_settings(self) -> Dict[str, Any]:
         default_settings: Dict[str, Any] = {
@@ -106,7 +264,8 @@ class MainWindow(Tk):
                 "volume": False,
                 "arc_length": False,
                 "plot3d": False,
-            }
+            },
+            "max_3d_points": self.MAX_3D_POINTS,
         }
         try:
             if os.path.exists(USER_SETTINGS_FILE):
@@ -115,25 +274,45 @@ class MainWindow(Tk):
                 for key, value in default_settings["tutorial_shown"].items():
                     if key not in settings.get("tutorial_shown", {}):
                         settings.setdefault("tutorial_shown", {})[key] = value
+                settings.setdefault("max_3d_points", self.MAX_3D_POINTS)
                 return settings
         except (json.JSONDecodeError, IOError) as e:
             logging.warning(f"Could not load user settings: {e}. Using defaults.")
         return default_settings
 
     def _save_user_settings(self) -> None:
+        # Write to a temporary file and swap it in, so an interrupted write
+        # never leaves a truncated settings file behind.
+        tmp_path = USER_SETTINGS_FILE + ".tmp"
         try:
-            with open(USER_SETTINGS_FILE, "w") as f:
+            with open(tmp_path, "w") as f:
                 json.dump(self.user_settings, f, indent=4)
+            os.replace(tmp_path, USER_SETTINGS_FILE)
         except IOError as e:
             logging.error(f"Could not save user settings: {e}")
 
+    def _mark_settings_dirty(self) -> None:
+        """Schedules a settings write for when the event loop is idle."""
+        self._settings_dirty = True
+        if self._settings_flush_id is None:
+            self._settings_flush_id = self.after_idle(self._flush_settings)
+
+    def _flush_settings(self) -> None:
+        """Writes the settings to disk if they changed since the last write."""
+        if self._settings_flush_id is not None:
+            self.after_cancel(self._settings_flush_id)
+            self._settings_flush_id = None
+        if self._settings_dirty:
+            self._save_user_settings()
+            self._settings_dirty = False
+
     def _show_tutorial_if_first_time(self, tutorial_key: str) -> None:
         if not self.user_settings["tutorial_shown"].get(tutorial_key, False):
             title = self._(f"tutorial_{tutorial_key}_title")
             message = self._(f"tutorial_{tutorial_key}_message")
             messagebox.showinfo(title, message)
             self.user_settings["tutorial_shown"][tutorial_key] = True
-            self._save_user_settings()
+            self._mark_settings_dirty()
 
     def _setup_styles(self) -> None:
         style = ttk.Style(self)
@@ -151,6 +330,7 @@ class MainWindow(Tk):
         self.canvas.grid(row=0, column=0, sticky="nsew", padx=(10, 5), pady=10)
         self.canvas.on_selection_made = self._handle_selection
         self.canvas.on_calibration_point_added = self._handle_calibration_point
+        self.canvas.bind("<Configure>", self._on_canvas_configure, add="+")
 
         available_units = ["meters", "feet", "centimeters", "kilometers", "miles"]
         self.analysis_panel = AnalysisPanel(
@@ -235,7 +415,10 @@ class MainWindow(Tk):
 
     def _open_3d_plot_window(self) -> None:
         if self.plot3d_window is None or not self.plot3d_window.winfo_exists():
+            from topovision.gui.plot3d_window import Plot3DWindow
+
             self.plot3d_window = Plot3DWindow(self, lang=self._lang)
+            self._plot3d_last_input = None
             self.plot3d_window.start_live_update()
             self._show_tutorial_if_first_time("plot3d")
         self.plot3d_window.lift()
@@ -262,24 +445,19 @@ class MainWindow(Tk):
         width_px, height_px = x2 - x1, y2 - y1
         unit = self.analysis_panel.get_selected_unit()
 
-        if self.perspective_corrector:
-            tl = self.perspective_corrector.transform_point((x1, y1))
-            tr = self.perspective_corrector.transform_point((x2, y1))
-            bl = self.perspective_corrector.transform_point((x1, y2))
-            br = self.perspective_corrector.transform_point((x2, y2))
-            width_corr = (
-                np.linalg.norm(np.array(tr) - np.array(tl))
-                + np.linalg.norm(np.array(br) - np.array(bl))
-            ) / 2
-            height_corr = (
-                np.linalg.norm(np.array(bl) - np.array(tl))
-                + np.linalg.norm(np.array(br) - np.array(tr))
-            ) / 2
+        corrector = self.perspective_corrector
+        if corrector:
+            tl, tr, bl, br = corrector.transform_points(
+                ((x1, y1), (x2, y1), (x1, y2), (x2, y2))
+            ).tolist()
+            # Plain float math on the corner tuples; no temporary arrays.
+            width_corr = (math.dist(tr, tl) + math.dist(br, bl)) / 2
+            height_corr = (math.dist(bl, tl) + math.dist(br, tr)) / 2
             width_unit = self.unit_converter.convert_distance(
-                cast(float, width_corr), "pixels", unit  # Cast to float
+                width_corr, "pixels", unit
             )
             height_unit = self.unit_converter.convert_distance(
-                cast(float, height_corr), "pixels", unit  # Cast to float
+                height_corr, "pixels", unit
             )
         else:
             width_unit = self.unit_converter.convert_distance(width_px, "pixels", unit)
@@ -306,7 +484,6 @@ class MainWindow(Tk):
         if self._last_frame is None:
             self.set_status(self._("no_frame_to_analyze"), is_error=True)
             return
-        self._show_tutorial_if_first_time(method)
         try:
             z_factor = self.analysis_panel.get_z_factor()
             scale = self.analysis_panel.get_scale()
@@ -316,25 +493,27 @@ class MainWindow(Tk):
             )
         except ValueError as e:
             self.set_status(str(e), is_error=True)
+        # The tutorial dialog is modal; open it once the task is on its way so
+        # the analysis runs while the user reads it.
+        self.after(0, self._show_tutorial_if_first_time, method)
 
     def _perform_calculation(
         self, method: str, z_factor: float, unit: str, scale: float
     ) -> Dict[str, Any]:
-        if self.selected_region is None or self._last_frame is None:
+        # Snapshot the inputs: the UI thread keeps replacing them meanwhile.
+        frame, selected_region = self._last_frame, self.selected_region
+        if selected_region is None or frame is None:
             raise RuntimeError("Missing data for calculation.")
 
-        x1, y1, x2, y2 = self.selected_region
-        h, w, _ = self._last_frame.shape
-        canvas_w, canvas_h = self.canvas.winfo_width(), self.canvas.winfo_height()
-
-        rx1, ry1 = int(x1 * w / canvas_w), int(y1 * h / canvas_h)
-        rx2, ry2 = int(x2 * w / canvas_w), int(y2 * h / canvas_h)
+        rx1, ry1, rx2, ry2 = _region_in_frame(
+            selected_region, frame.shape, self.canvas.canvas_size
+        )
 
         calc_result_data: Dict[str, Any] = {}
         data_for_analysis_image: NDArray[Any]  # Use NDArray[Any]
 
         # Initialize these variables to None
-        inverse_local_matrix: Optional[NDArray[np.float32]] = None
+        inverse_local_matrix: Optional[NDArray[np.float64]] = None
         src_quad: Optional[NDArray[np.float32]] = None
 
         if self.perspective_corrector:
@@ -342,12 +521,9 @@ class MainWindow(Tk):
                 [[rx1, ry1], [rx2, ry1], [rx2, ry2], [rx1, ry2]], dtype=np.float32
             )
 
-            transformed_corners: NDArray[np.float32] = cast(
-                NDArray[np.float32],
-                cv2.perspectiveTransform(
-                    np.array([src_quad]), self.perspective_corrector.matrix
-                )[0],
-            )
+            transformed_corners = self.perspective_corrector.transform_points(
+                src_quad
+            ).astype(np.float32)
 
             rect = cv2.boundingRect(transformed_corners)
             dst_w, dst_h = rect[2], rect[3]
@@ -364,16 +540,16 @@ class MainWindow(Tk):
                 NDArray[np.float32], cv2.getPerspectiveTransform(src_quad, dst_rect)
             )
             inverse_local_matrix = cast(
-                NDArray[np.float32], cv2.getPerspectiveTransform(dst_rect, src_quad)
+                NDArray[np.float64], cv2.getPerspectiveTransform(dst_rect, src_quad)
             )  # This is where it's defined
 
             warped_roi: NDArray[Any] = cv2.warpPerspective(
-                self._last_frame, local_matrix, (dst_w, dst_h)
+                frame, local_matrix, (dst_w, dst_h)
             )
             data_for_analysis_image = warped_roi
 
         else:
-            data_for_analysis_image = self._last_frame[ry1:ry2, rx1:rx2]
+            data_for_analysis_image = frame[ry1:ry2, rx1:rx2]
 
         # Assign these outside the if block
         calc_result_data["inverse_matrix"] = inverse_local_matrix
@@ -385,14 +561,15 @@ class MainWindow(Tk):
                 data_for_analysis_image, cv2.COLOR_RGB2GRAY
             )
         elif method == "arc_length":
-            gray_region: NDArray[Any] = cv2.cvtColor(
-                data_for_analysis_image, cv2.COLOR_RGB2GRAY
-            )  # Use NDArray[Any]
-            middle_row_idx = gray_region.shape[0] // 2
-            points = [
-                (i, gray_region[middle_row_idx, i]) for i in range(gray_region.shape[1])
-            ]
-            data_for_analysis = np.array(points)
+            # Only the middle row is profiled, so only that row is converted.
+            middle_row_idx = data_for_analysis_image.shape[0] // 2
+            gray_row: NDArray[Any] = cv2.cvtColor(
+                data_for_analysis_image[middle_row_idx : middle_row_idx + 1],
+                cv2.COLOR_RGB2GRAY,
+            )[0]
+            data_for_analysis = np.column_stack(
+                (np.arange(gray_row.size, dtype=np.float32), gray_row)
+            )
         else:
             raise ValueError(f"Unknown analysis method: {method}")
 
@@ -406,31 +583,52 @@ class MainWindow(Tk):
         result_obj = self.calculus_module.calculate(data_for_analysis, **calc_kwargs)
 
         calc_result_data.update(
-            {"method": method, "result": result_obj, "region": self.selected_region}
+            {"method": method, "result": result_obj, "region": selected_region}
         )
+        if method == "gradient" and isinstance(result_obj, GradientResult):
+            # Render the heatmap here too, so the UI thread only has to blit it.
+            calc_result_data["heatmap"] = self.visualizer.render(
+                AnalysisResult(method, result_obj, RegionOfInterest(*selected_region)),
+                frame,
+                inverse_matrix=inverse_local_matrix,
+                src_quad=src_quad,
+            )
         return calc_result_data
 
     def _process_results(self) -> None:
         result = self.task_queue.get_result()
-        if result:
+        while result:
             if isinstance(result, Exception):
                 self.set_status(
                     self._("calculation_error", error=result), is_error=True
                 )
+            elif result.get("method") == _PLOT3D_TASK:
+                self._deliver_3d_plot_data(result)
             else:
                 self._handle_calculation_result(result)
-        self.after(100, self._process_results)
+            result = self.task_queue.get_result()
+
+    def _notify_task_result(self) -> None:
+        """
+        Wakes the Tk event loop to collect a finished task's result.
+
+        Runs on the task worker thread; Tk marshals the event to the UI thread.
+        """
+        try:
+            self.event_generate("<<TaskResult>>", when="tail")
+        except (RuntimeError, tk.TclError):
+            # The main loop is not running (yet or any more); the result stays
+            # queued and is collected on the next notification.
+            logging.debug("Could not post <<TaskResult>>; result left queued.")
 
     def _handle_calculation_result(self, result: Dict[str, Any]) -> None:
         method: str = result["method"]
         calc_result = result["result"]
-        region_coords: Optional[Tuple[int, int, int, int]] = result.get("region")
-        if not region_coords:
+        if not result.get("region"):
             self.set_status(
                 self._("calculation_error", error="Missing region"), is_error=True
             )
             return
-        region = RegionOfInterest(*region_coords)
 
         if method == "gradient" and isinstance(calc_result, GradientResult):
             self.set_status(
@@ -440,17 +638,8 @@ class MainWindow(Tk):
                     dy=np.mean(calc_result.dz_dy),
                 )
             )
-            if self._last_frame is not None:
-                original_image_pil = cast(
-                    Image.Image, Image.fromarray(self._last_frame)
-                )
-                analysis_result = AnalysisResult(method, calc_result, region)
-                heatmap = self.visualizer.visualize(
-                    analysis_result,
-                    original_image_pil,
-                    inverse_matrix=result.get("inverse_matrix"),
-                    src_quad=result.get("src_quad"),
-                )
+            heatmap: Optional[NDArray[np.uint8]] = result.get("heatmap")
+            if heatmap is not None:
                 self.display_result_image(heatmap)
         elif method == "volume" and isinstance(calc_result, VolumeResult):
             self.set_status(
@@ -479,6 +668,7 @@ class MainWindow(Tk):
         self.canvas.clear_selection()
         self.selected_region = None
         self.set_status(self._("selection_cleared"))
+        self._plot3d_last_input = None
         if self.plot3d_window and self.plot3d_window.winfo_exists():
             self.plot3d_window.clear_plot_data()
 
@@ -493,22 +683,56 @@ class MainWindow(Tk):
                 f"view_changed_to_{'analysis' if self.is_showing_analysis else 'camera'}"
             )
         )
-        self._refresh_gui_display()
-
-    def display_result_image(self, pil_image: Image.Image) -> None:
-        w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if (
+            not self.is_showing_analysis
+            and self._preview_stale
+            and self._last_frame is not None
+        ):
+            self._update_canvas_image(self._last_frame)
+        else:
+            self._schedule_refresh()
+
+    def display_result_image(self, image: NDArray[np.uint8]) -> None:
+        """
+        Scales an analysis image to the canvas and shows it.
+
+        ``image`` is an (H, W, 3) RGB array as produced by
+        :meth:`HeatmapVisualizer.render`. Tk only ever receives opaque RGB: an
+        alpha channel is dropped rather than composited, since Tk blits images
+        with alpha far more slowly.
+        """
+        w, h = self.canvas.canvas_size
         if w > 1 and h > 1:
-            resized_img = pil_image.resize((w, h), Image.Resampling.LANCZOS)
-            self._analysis_result_photo = ImageTk.PhotoImage(
-                image=resized_img
-            )  # Removed redundant cast
+            # OpenCV's area resampler is much cheaper than PIL's LANCZOS and
+            # the result goes to Tk as PPM without a PIL round trip.
+            channels = image.shape[2] if image.ndim == 3 else 1
+            conversion = _RGB_CONVERSIONS.get(channels)
+            if conversion is not None:
+                image = cast(NDArray[np.uint8], cv2.cvtColor(image, conversion))
+            cv2.resize(
+                image,
+                (w, h),
+                dst=self._canvas_rgb_buffer(w, h),
+                interpolation=cv2.INTER_AREA,
+            )
+            ppm_data = bytes(cast(bytearray, self._ppm_buf))
+            # Reuse the previous result's photo when the size is unchanged.
+            photo = self._analysis_result_photo
+            if photo is not None and (photo.width(), photo.height()) == (w, h):
+                photo.configure(data=ppm_data, format="PPM")
+            else:
+                self._analysis_result_photo = tk.PhotoImage(
+                    width=w, height=h, data=ppm_data, format="PPM"
+                )
             self.is_showing_analysis = True
             self.set_status(self._("analysis_completed"))
-            self._refresh_gui_display()
+            self._schedule_refresh()
 
     def toggle_camera(self) -> None:
         try:
             self.camera_controller.toggle()
+            if self.camera_controller.is_running:
+                self._schedule_frame_tick(0)
             self.btn_toggle_camera.config(
                 text=self._(
                     f"{'pause' if self.camera_controller.is_running else 'resume'}_camera_button"
@@ -523,67 +747,205 @@ class MainWindow(Tk):
         except Exception as e:
             self.set_status(self._("camera_error", error=e), is_error=True)
 
-    def _update_frame(self) -> None:
-        if self.camera_controller.is_running:
-            frame = self.camera_controller.get_frame()
-            if frame is not None:
-                denoised_frame = self.preprocessor.process(frame)
-                self._last_frame = denoised_frame
-                self._update_canvas_image(denoised_frame)
-                if (
-                    self.plot3d_window
-                    and self.plot3d_window.winfo_exists()
-                    and self.selected_region
-                ):
-                    self.plot3d_window.set_latest_data(*self._prepare_3d_plot_data())
-        self.after(15, self._update_frame)
+    def _notify_capture_failed(self, error: Exception) -> None:
+        """
+        Posts the capture thread's failure to the UI thread.
 
-    def _prepare_3d_plot_data(
-        self,
-    ) -> Tuple[NDArray[Any], NDArray[Any], NDArray[Any]]:  # Use NDArray[Any]
-        if not self.selected_region or self._last_frame is None:
-            return np.array([]), np.array([]), np.array([])
+        Runs on the capture thread; the error itself is read back from the
+        controller by :meth:`_handle_capture_failure`.
+        """
+        try:
+            self.event_generate("<<CaptureFailed>>", when="tail")
+        except (RuntimeError, tk.TclError):
+            logging.debug("Could not post <<CaptureFailed>>: %s", error)
 
-        x1, y1, x2, y2 = self.selected_region
-        h, w, _ = self._last_frame.shape
-        canvas_w, canvas_h = self.canvas.winfo_width(), self.canvas.winfo_height()
-        rx1, ry1 = int(x1 * w / canvas_w), int(y1 * h / canvas_h)
-        rx2, ry2 = int(x2 * w / canvas_w), int(y2 * h / canvas_h)
+    def _handle_capture_failure(self) -> None:
+        """Pauses the feed after a capture failure so it can be resumed."""
+        error = self.camera_controller.capture_error
+        try:
+            self.camera_controller.pause()
+        except Exception as e:
+            logging.error("Failed to pause camera after capture failure: %s", e)
+        self.btn_toggle_camera.config(text=self._("resume_camera_button"))
+        self.set_status(self._("camera_error", error=error), is_error=True)
+
+    def _schedule_frame_tick(self, delay_ms: Optional[int]) -> None:
+        """
+        Schedules the next preview tick, replacing any pending one. A delay of
+        None runs it as soon as the event loop is idle.
+        """
+        if self._tick_id is not None:
+            self.after_cancel(self._tick_id)
+        if delay_ms is None:
+            self._tick_id = self.after_idle(self._update_frame)
+        else:
+            self._tick_id = self.after(delay_ms, self._update_frame)
 
+    def _update_frame(self) -> None:
+        self._tick_id = None
+        if not self.camera_controller.is_running:
+            # Nothing to poll while paused; toggle_camera re-arms the loop.
+            return
+        if self._preview_hidden():
+            # Nothing on screen to update: stop the capture thread and only
+            # check, at a slow rate, whether the window has come back.
+            self.camera_controller.set_capture_suspended(True)
+            self._schedule_frame_tick(self.HIDDEN_POLL_MS)
+            return
+        self.camera_controller.set_capture_suspended(False)
+        t0 = time.perf_counter()
+        frame = self.camera_controller.get_frame()
+        # The controller hands back the very same (already denoised) array
+        # until the camera delivers a new frame, so repeats are skipped by
+        # identity.
+        if frame is not None and frame is not self._last_frame:
+            self._last_frame = frame
+            # The live image is hidden behind the analysis view; build it
+            # only once the view switches back (see toggle_view).
+            if self.is_showing_analysis:
+                self._preview_stale = True
+            else:
+                self._update_canvas_image(frame)
+            if (
+                self.plot3d_window
+                and self.plot3d_window.winfo_exists()
+                and self.selected_region
+            ):
+                self._request_3d_plot_data()
+        # Subtract the time spent in this tick so slow frames don't pile up
+        # callbacks behind each other in the event queue.
+        elapsed_ms = int((time.perf_counter() - t0) * 1000)
+        if elapsed_ms < self.FRAME_INTERVAL_MS:
+            self._schedule_frame_tick(self.FRAME_INTERVAL_MS - elapsed_ms)
+        else:
+            # The tick overran its slot: run the next one only once Tk has
+            # handled pending input and redraws. Frames the camera delivers
+            # meanwhile are dropped, as only the latest one is kept.
+            self._schedule_frame_tick(None)
+
+    def _preview_hidden(self) -> bool:
+        """
+        Returns True while no output of the preview loop can be seen: the main
+        window is minimized or withdrawn and no 3D plot window is showing.
+        """
+        if self.state() not in ("iconic", "withdrawn") and self.winfo_viewable():
+            return False
+        plot_window = self.plot3d_window
+        return not (
+            plot_window and plot_window.winfo_exists() and plot_window.winfo_viewable()
+        )
+
+    def _request_3d_plot_data(self) -> None:
+        """
+        Queues the 3D surface data for the latest frame on the worker thread.
+
+        The Tk-owned inputs are read here, on the UI thread. At most one job is
+        in flight and jobs are limited to PLOT3D_MAX_FPS; frames that arrive
+        meanwhile are skipped, since the plot window only redraws a few times
+        per second anyway. A frame is also skipped when the inputs are the same
+        as for the last job and a sparse sample of the region has not changed.
+        """
+        if self._plot3d_pending or not self.selected_region:
+            return
+        frame = self._last_frame
+        if frame is None:
+            return
+        now = time.monotonic()
+        if now - self._plot3d_last_request < 1.0 / self.PLOT3D_MAX_FPS:
+            return
         try:
             z_factor = self.analysis_panel.get_z_factor()
             scale = self.analysis_panel.get_scale()
         except ValueError:
             z_factor = 1.0
             scale = 100.0
+        inputs = (
+            self.selected_region,
+            self.canvas.canvas_size,
+            self.perspective_corrector,
+            z_factor,
+            scale,
+            int(self.user_settings.get("max_3d_points", self.MAX_3D_POINTS)),
+        )
+        rx1, ry1, rx2, ry2 = _region_in_frame(
+            self.selected_region, frame.shape, self.canvas.canvas_size
+        )
+        stride = self.PLOT3D_SAMPLE_STRIDE
+        sample = np.ascontiguousarray(frame[ry1:ry2:stride, rx1:rx2:stride])
+        last = self._plot3d_last_input
+        if (
+            last is not None
+            and last[0] == inputs
+            and last[1].shape == sample.shape
+            and cv2.norm(sample, last[1], cv2.NORM_L1)
+            <= self.PLOT3D_CHANGE_THRESHOLD * sample.size
+        ):
+            return
+        self._plot3d_last_input = (inputs, sample)
+        self._plot3d_last_request = now
+        self._plot3d_pending = True
+        self.task_queue.submit_task(self._compute_3d_plot_task, frame, *inputs)
+
+    def _compute_3d_plot_task(self, *args: Any) -> Dict[str, Any]:
+        """Worker-side wrapper that always answers, so the job slot is freed."""
+        try:
+            data: Optional[Tuple[NDArray[Any], ...]] = self._prepare_3d_plot_data(*args)
+        except Exception:
+            logging.exception("Could not prepare 3D plot data.")
+            data = None
+        return {"method": _PLOT3D_TASK, "data": data}
+
+    def _deliver_3d_plot_data(self, result: Dict[str, Any]) -> None:
+        """Hands worker-computed surface data to the 3D window."""
+        self._plot3d_pending = False
+        data = result["data"]
+        if data is None:
+            self._plot3d_last_input = None  # Retry with the next frame
+        if (
+            data is not None
+            and self.selected_region
+            and self.plot3d_window
+            and self.plot3d_window.winfo_exists()
+        ):
+            self.plot3d_window.set_latest_data(*data)
+
+    def _prepare_3d_plot_data(
+        self,
+        frame: NDArray[Any],
+        selected_region: Tuple[int, int, int, int],
+        canvas_size: Tuple[int, int],
+        perspective_corrector: Optional[PerspectiveCorrector],
+        z_factor: float,
+        scale: float,
+        max_points: int,
+    ) -> Tuple[NDArray[Any], NDArray[Any], NDArray[Any]]:  # Use NDArray[Any]
+        rx1, ry1, rx2, ry2 = _region_in_frame(selected_region, frame.shape, canvas_size)
 
         meters_per_pixel = 1.0 / scale
+        # Single precision is plenty for a plot and halves the size of Z.
+        z_scale = np.float32(z_factor * meters_per_pixel)
 
         # Initialize variables before conditional blocks
         real_width: float = 0.0
         real_height: float = 0.0
         gray_region: NDArray[Any] = np.array([])
-        x_coords: NDArray[np.float64] = np.array([])
-        y_coords: NDArray[np.float64] = np.array([])
-        Z: NDArray[np.float64] = np.array([])
+        Z: NDArray[np.float32] = np.array([], dtype=np.float32)
 
-        if self.perspective_corrector:
+        if perspective_corrector:
             src_quad: NDArray[np.float32] = np.array(
                 [[rx1, ry1], [rx2, ry1], [rx2, ry2], [rx1, ry2]], dtype=np.float32
             )
 
-            transformed_corners: NDArray[np.float32] = cast(
-                NDArray[np.float32],
-                cv2.perspectiveTransform(
-                    np.array([src_quad]), self.perspective_corrector.matrix
-                )[0],
-            )
+            transformed_corners = perspective_corrector.transform_points(
+                src_quad
+            ).astype(np.float32)
 
             rect = cv2.boundingRect(transformed_corners)
-            dst_w, dst_h = rect[2], rect[3]
-
-            if dst_w < 1 or dst_h < 1:
+            if rect[2] < 1 or rect[3] < 1:
                 return np.array([]), np.array([]), np.array([])
+            # Warp straight to the capped plot size rather than downscaling
+            # a full-resolution warp afterwards.
+            dst_h, dst_w = _capped_grid_size(rect[3], rect[2], max_points)
 
             dst_rect: NDArray[np.float32] = np.array(
                 [[0, 0], [dst_w - 1, 0], [dst_w - 1, dst_h - 1], [0, dst_h - 1]],
@@ -594,7 +956,7 @@ class MainWindow(Tk):
                 NDArray[np.float32], cv2.getPerspectiveTransform(src_quad, dst_rect)
             )
             warped_roi: NDArray[Any] = cv2.warpPerspective(
-                self._last_frame, local_matrix, (dst_w, dst_h)
+                frame, local_matrix, (dst_w, dst_h)
             )
 
             gray_region = cv2.cvtColor(warped_roi, cv2.COLOR_RGB2GRAY)
@@ -626,58 +988,153 @@ class MainWindow(Tk):
                 ),
             )
 
-            x_coords = np.linspace(0, real_width, dst_w)
-            y_coords = np.linspace(0, real_height, dst_h)
-            X, Y = np.meshgrid(x_coords, y_coords)
-            Z = gray_region * z_factor * meters_per_pixel
+            X, Y = _plot_grid(dst_h, dst_w, real_width, real_height)
+            Z = np.multiply(gray_region, z_scale, dtype=np.float32)
 
         else:
-            region_data: NDArray[Any] = self._last_frame[ry1:ry2, rx1:rx2]
+            region_data: NDArray[Any] = frame[ry1:ry2, rx1:rx2]
             if region_data.size == 0:
                 return np.array([]), np.array([]), np.array([])
 
             gray_region = cv2.cvtColor(region_data, cv2.COLOR_RGB2GRAY)
             rows, cols = gray_region.shape
+            plot_rows, plot_cols = _capped_grid_size(rows, cols, max_points)
+            if (plot_rows, plot_cols) != (rows, cols):
+                gray_region = cv2.resize(
+                    gray_region, (plot_cols, plot_rows), interpolation=cv2.INTER_AREA
+                )
 
             real_width = cast(float, cols * meters_per_pixel)
             real_height = cast(float, rows * meters_per_pixel)
 
-            x_coords = np.linspace(0, real_width, cols)
-            y_coords = np.linspace(0, real_height, rows)
-            X, Y = np.meshgrid(x_coords, y_coords)
-            Z = gray_region * z_factor * meters_per_pixel
+            X, Y = _plot_grid(plot_rows, plot_cols, real_width, real_height)
+            Z = np.multiply(gray_region, z_scale, dtype=np.float32)
 
         return X, Y, Z
 
     def _update_canvas_image(self, frame: NDArray[Any]) -> None:  # Use NDArray[Any]
-        w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
+        w, h = self.canvas.canvas_size
         if w > 1 and h > 1:
-            resized = cv2.resize(frame, (w, h), interpolation=cv2.INTER_AREA)
-            img = cast(
-                Image.Image, Image.fromarray(cv2.cvtColor(resized, cv2.COLOR_BGR2RGB))
-            )
-            self.photo = cast(
-                ImageTk.PhotoImage, ImageTk.PhotoImage(image=img)
-            )  # Added cast
-            self._refresh_gui_display()
+            # The preview buffers are reused until the canvas or frame layout
+            # changes; Tk copies the pixels, so overwriting them is safe.
+            rgb_buf = self._canvas_rgb_buffer(w, h)
+            conversion = _RGB_CONVERSIONS.get(frame.shape[2] if frame.ndim == 3 else 1)
+            if frame.shape[:2] == (h, w):
+                # Already canvas-sized: copy or convert it into the PPM payload.
+                if conversion is None:
+                    np.copyto(rgb_buf, frame)
+                else:
+                    cv2.cvtColor(frame, conversion, dst=rgb_buf)
+            elif (
+                PARALLEL_PREVIEW
+                and self.preview_interpolation == cv2.INTER_NEAREST
+                and frame.dtype == np.uint8
+                and frame.shape[2:] == (3,)
+                and frame.flags.c_contiguous
+            ):
+                resize_nearest(frame, rgb_buf)
+            elif conversion is None:
+                # RGB frames need no conversion: resize straight into the PPM.
+                cv2.resize(
+                    frame,
+                    (w, h),
+                    dst=rgb_buf,
+                    interpolation=self.preview_interpolation,
+                )
+            else:
+                # RGBA and greyscale frames are resized first so cvtColor only
+                # touches canvas-sized pixels.
+                buf_shape = (h, w) + frame.shape[2:]
+                resized_buf = self._resized_buf
+                if (
+                    resized_buf is None
+                    or resized_buf.shape != buf_shape
+                    or resized_buf.dtype != frame.dtype
+                ):
+                    resized_buf = self._resized_buf = np.empty(buf_shape, frame.dtype)
+                cv2.resize(
+                    frame,
+                    (w, h),
+                    dst=resized_buf,
+                    interpolation=self.preview_interpolation,
+                )
+                cv2.cvtColor(resized_buf, conversion, dst=rgb_buf)
+            # Reload the existing photo in place while the size is unchanged;
+            # Tk redraws every item showing it, so the canvas needs no update.
+            # rgb_buf is the pixel payload of _ppm_buf, so the PPM data is a
+            # single copy of the buffer rather than tobytes() plus a header join.
+            ppm_data = bytes(cast(bytearray, self._ppm_buf))
+            photo = self.photo
+            if photo is not None and self._photo_size == (w, h):
+                photo.configure(data=ppm_data, format="PPM")
+            else:
+                self.photo = tk.PhotoImage(
+                    width=w, height=h, data=ppm_data, format="PPM"
+                )
+                self._photo_size = (w, h)
+            self._preview_stale = False
+            self._schedule_refresh()
+
+    def _canvas_rgb_buffer(self, w: int, h: int) -> NDArray[np.uint8]:
+        """
+        Returns the (h, w, 3) pixel view of the canvas-sized PPM buffer.
+
+        The live preview and analysis results share this buffer; it is only
+        reallocated when the canvas size changes.
+        """
+        rgb_buf = self._rgb_buf
+        if rgb_buf is None or rgb_buf.shape[:2] != (h, w):
+            self._ppm_buf, rgb_buf = _ppm_frame_buffer(w, h)
+            self._rgb_buf = rgb_buf
+        return rgb_buf
+
+    def _schedule_refresh(self) -> None:
+        """
+        Requests a canvas refresh once the event loop is idle, so bursts of
+        frames and results within one loop iteration update the canvas once.
+        """
+        if self._refresh_id is None:
+            self._refresh_id = self.after_idle(self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self) -> None:
+        self._refresh_id = None
+        self._refresh_gui_display()
 
     def _refresh_gui_display(self) -> None:
         photo = self._analysis_result_photo if self.is_showing_analysis else self.photo
         if not photo:
             self._update_initial_canvas_message()
             return
+        # Nothing to send to Tcl if the canvas already shows this image, e.g.
+        # while the analysis view is up and live frames keep arriving.
+        if photo is self._displayed_photo:
+            return
+        # The canvas keeps a single image item. Never create one per refresh:
+        # canvas items are not garbage collected, and every extra item is
+        # redrawn on each repaint.
         if self._canvas_image_id:
             self.canvas.itemconfig(self._canvas_image_id, image=photo)
         else:
             self._canvas_image_id = self.canvas.create_image(
                 0, 0, image=photo, anchor=tk.NW
             )
+            if self._idle_text_id is not None:
+                self.canvas.delete(self._idle_text_id)
+                self._idle_text_id = None
+        self._displayed_photo = photo
 
     def _update_initial_canvas_message(self) -> None:
-        self.canvas.delete("all")
-        w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
-        if w > 100 and h > 100:
-            self.canvas.create_text(
+        """
+        Shows the idle prompt, centred on the canvas.
+
+        The text item is created once and afterwards only moved, e.g. when the
+        canvas is resized while no image has been displayed yet.
+        """
+        w, h = self.canvas.canvas_size
+        if w <= 100 or h <= 100:
+            return
+        if self._idle_text_id is None:
+            self._idle_text_id = self.canvas.create_text(
                 w / 2,
                 h / 2,
                 text=self._("click_to_start"),
@@ -686,11 +1143,33 @@ class MainWindow(Tk):
                 justify="center",
                 width=w - 40,
             )
+        else:
+            self.canvas.coords(self._idle_text_id, w / 2, h / 2)
+            self.canvas.itemconfigure(self._idle_text_id, width=w - 40)
+
+    def _on_canvas_configure(self, event: tk.Event) -> None:  # Removed [Any]
+        """Draws or re-centres the idle prompt until an image is shown."""
+        if self._canvas_image_id is None:
+            self._update_initial_canvas_message()
 
     def _on_exit(self) -> None:
+        # Serving events while the task worker stops can deliver a second
+        # close request; only the first one shuts down.
+        if self._closing:
+            return
+        self._closing = True
         self.set_status(self._("closing_app"))
+        for after_id in (self._tick_id, self._refresh_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._tick_id = self._refresh_id = None
+        self._flush_settings()
         self.camera_controller.stop()
-        self.task_queue.stop()
+        self.unbind("<<TaskResult>>")
+        self.task_queue.set_result_listener(None)
+        # A worker already inside event_generate waits for this thread to
+        # serve the event, so keep the event loop turning while it winds down.
+        self.task_queue.stop(on_wait=self.update)
         if self.plot3d_window and self.plot3d_window.winfo_exists():
             self.plot3d_window.stop_live_update()
             self.plot3d_window.destroy()
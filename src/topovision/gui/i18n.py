@@ -266,6 +266,14 @@ LANGUAGES: Dict[str, Dict[str, str]] = {
 }
 
 
+# Each language's messages with the default language filling any gaps,
+# merged once at import so a lookup is a single dict access.
+_MERGED_LANGUAGES: Dict[str, Dict[str, str]] = {
+    lang: {**LANGUAGES[DEFAULT_LANG], **messages}
+    for lang, messages in LANGUAGES.items()
+}
+
+
 class Translator(Protocol):
     def __call__(self, key: str, **kwargs: Any) -> str: ...
 
@@ -274,16 +282,15 @@ def get_translator(lang: str) -> Translator:
     """
     Returns a translation function for the given language.
     """
-    translations = LANGUAGES.get(lang, LANGUAGES[DEFAULT_LANG])
-    default_translations = LANGUAGES[DEFAULT_LANG]
+    lookup = _MERGED_LANGUAGES.get(lang, _MERGED_LANGUAGES[DEFAULT_LANG]).get
 
     def translate(key: str, **kwargs: Any) -> str:
         """
         Translates the given key.
         """
-        message = translations.get(key, default_translations.get(key, key))
+        message = lookup(key, key)
         if kwargs:
-            return message.format(**kwargs)
+            return message.format_map(kwargs)
         return message
 
     return translate
@@ -281,8 +281,8 @@ class Plot3DWindow(tk.Toplevel):
             self._redraw_plot_with_settings()
             return  # Exit to avoid further processing with mismatched data
 
-        # If shapes match, update the existing plot by removing old artists
-        # and adding new ones
+        # If shapes match, update the existing plot; the surface is updated
+        # in place when its polygon layout allows it
         if self.ax is not None:
             self.surface_plot_object, self.wireframe_plot_object = (
                 update_surface_plot_data(
@@ -47,6 +47,11 @@ THEMES: Dict[str, Dict[str, Dict[str, Any]]] = {
 
 DEFAULT_THEME = "dark"
 
+# Tcl global recording the theme applied to an interpreter. ttk styles live in
+# the interpreter rather than in any one window, so this is where the "already
+# applied" state has to live as well.
+_APPLIED_THEME_VAR = "::topovision_applied_theme"
+
 
 class ThemeManager:
     """Manages the application's visual theme."""
@@ -79,6 +84,14 @@ class ThemeManager:
 
         self.current_theme = self.themes[theme_name]
 
+        # Re-applying the active theme would only repeat the same Tcl calls.
+        tk_app = self.style.tk
+        if (
+            tk_app.call("info", "exists", _APPLIED_THEME_VAR)
+            and tk_app.globalgetvar(_APPLIED_THEME_VAR) == theme_name
+        ):
+            return
+
         # Ensure current_theme is not None before accessing its keys
         if self.current_theme is None:
             # This case should ideally not be reached due to the check above,
@@ -119,3 +132,4 @@ class ThemeManager:
             "Heading.TLabel", font=fonts["heading"], foreground=colors["primary"]
         )
         self.style.configure("TSeparator", background=colors["separator"])
+        tk_app.globalsetvar(_APPLIED_THEME_VAR, theme_name)
@@ -5,15 +5,16 @@ It acts as a central registry for dependencies, promoting a clean
 architecture and easier testing.
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from topovision.calculus.calculus_module import AnalysisContext
-from topovision.capture.capture_module import MockCamera, ThreadedOpenCVCamera
 from topovision.capture.preprocessing import GaussianBlurStrategy, ImagePreprocessor
 from topovision.core.interfaces import ICamera
-from topovision.gui.gui_module import MainWindow
 from topovision.services.task_queue import TaskQueue
 
+if TYPE_CHECKING:
+    from topovision.gui.gui_module import MainWindow
+
 
 class ServiceProvider:
     """
@@ -34,7 +35,7 @@ class ServiceProvider:
 
         # Lazily loaded services
         self._camera: Optional[ICamera] = None
-        self._main_window: Optional[MainWindow] = None
+        self._main_window: Optional["MainWindow"] = None
         self._analysis_context: Optional[AnalysisContext] = None
         self._task_queue: Optional[TaskQueue] = None
         self._image_preprocessor: Optional[ImagePreprocessor] = (
@@ -45,6 +46,11 @@ class ServiceProvider:
     def camera(self) -> ICamera:
         """Provides a camera instance (either real or mock)."""
         if self._camera is None:
+            from topovision.capture.capture_module import (
+                MockCamera,
+                ThreadedOpenCVCamera,
+            )
+
             if self._use_mock_camera:
                 self._camera = MockCamera()
             else:
@@ -78,12 +84,15 @@ class ServiceProvider:
         return self._task_queue
 
     @property
-    def main_window(self) -> MainWindow:
+    def main_window(self) -> "MainWindow":
         """
         Provides a MainWindow instance, injecting all required services.
         This ensures the MainWindow is properly initialized with its dependencies.
         """
         if self._main_window is None:
+            # Imported here so the GUI stack only loads when a window is needed.
+            from topovision.gui.gui_module import MainWindow
+
             self._main_window = MainWindow(
                 camera=self.camera,
                 calculus_module=self.analysis_context,  # Renamed to analysis_context
@@ -5,6 +5,7 @@ A thread-safe task queue for running background operations, preventing UI freeze
 import logging
 import queue
 import threading
+import time
 from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 # Configure logging for this module
@@ -30,6 +31,7 @@ class TaskQueue:
         ] = queue.Queue()
         self._result_queue: queue.Queue[Union[Any, Exception]] = queue.Queue()
         self._stop_event = threading.Event()
+        self._result_listener: Optional[Callable[[], None]] = None
         self._worker_thread: threading.Thread = threading.Thread(
             target=self._process_tasks, daemon=True
         )
@@ -51,7 +53,7 @@ class TaskQueue:
 
                 logger.debug(f"Executing task: {task.__name__}")
                 result = task(*args, **kwargs)
-                self._result_queue.put(result)
+                self._put_result(result)
             except queue.Empty:
                 continue  # No task, check stop event again
             except Exception as e:
@@ -59,13 +61,43 @@ class TaskQueue:
                 # put it in the result queue and log it.
                 task_name = task.__name__ if "task" in locals() else "unknown"
                 logger.error(f"Error executing task {task_name}: {e}", exc_info=True)
-                self._result_queue.put(e)
+                self._put_result(e)
             finally:
                 # Mark the task as done ONLY if a task was successfully retrieved
                 if task_item is not None:
                     self._task_queue.task_done()
         logger.info("TaskQueue worker thread stopped.")
 
+    def _put_result(self, result: Union[Any, Exception]) -> None:
+        """
+        Queues a result and notifies the result listener, if one is set.
+
+        The listener runs on the worker thread; a failing listener is logged
+        and never affects the worker or the queued result.
+        """
+        self._result_queue.put(result)
+        listener = self._result_listener
+        if listener is not None:
+            try:
+                listener()
+            except Exception as e:
+                logger.warning(f"Result listener failed: {e}")
+
+    def set_result_listener(self, listener: Optional[Callable[[], None]]) -> None:
+        """
+        Registers a callback invoked after each result is queued.
+
+        This lets a consumer wake up when there is something to collect
+        instead of polling :meth:`get_result` on a timer. The callback is
+        called from the worker thread, so it must be thread-safe (e.g.
+        posting an event to the GUI's event loop).
+
+        Args:
+            listener (Optional[Callable[[], None]]): The callback, or None to
+                remove the current one.
+        """
+        self._result_listener = listener
+
     def submit_task(self, task: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
         """
         Submits a new task to be executed in the background.
@@ -92,14 +124,29 @@ class TaskQueue:
         except queue.Empty:
             return None
 
-    def stop(self) -> None:
+    def stop(self, on_wait: Optional[Callable[[], None]] = None) -> None:
         """
         Signals the worker thread to stop and waits for it to terminate.
         This should be called when the application is shutting down.
+
+        Args:
+            on_wait (Optional[Callable[[], None]]): Called repeatedly while
+                waiting. A result listener may be blocked on the calling
+                thread (e.g. a GUI event posted to a busy event loop); pass a
+                callback that serves it so the worker can finish.
         """
         logger.info("Stopping TaskQueue worker thread...")
         self._stop_event.set()
         # Wait for any currently processing tasks to finish and for the thread to exit
-        self._worker_thread.join(timeout=5)  # Give it some time to finish
+        deadline = time.monotonic() + 5  # Give it some time to finish
+        while self._worker_thread.is_alive():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if on_wait is None:
+                self._worker_thread.join(timeout=remaining)
+            else:
+                on_wait()
+                self._worker_thread.join(timeout=min(remaining, 0.05))
         if self._worker_thread.is_alive():
             logger.warning("TaskQueue worker thread did not terminate gracefully.")
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 
 import numpy as np
 
+from topovision.calculus._kernels import grad_fused, grad_fused_numpy
 from topovision.calculus.calculus_module import AnalysisContext
 from topovision.calculus.strategies import (
     ArcLengthStrategy,
@@ -10,6 +11,11 @@ from topovision.calculus.strategies import (
     VolumeStrategy,
 )
 from topovision.core.models import ArcLengthResult, GradientResult, VolumeResult
+from topovision.utils.math import (
+    arc_length_kernel,
+    arc_length_numpy,
+    calculate_arc_length,
+)
 
 
 class TestAnalysisContext(unittest.TestCase):
@@ -65,6 +71,46 @@ class TestAnalysisStrategies(unittest.TestCase):
         self.assertEqual(result.dz_dx.shape, self.data_2d.shape)
         self.assertEqual(result.dz_dy.shape, self.data_2d.shape)
 
+    def test_gradient_strategy_matches_numpy(self) -> None:
+        """Test the fused gradient kernel against np.gradient."""
+        rng = np.random.default_rng(0)
+        data = rng.integers(0, 256, size=(37, 53), dtype=np.uint8)
+        result = self.gradient_strategy.analyze(
+            data, z_factor=1.5, pixels_per_meter=4.0
+        )
+
+        expected_dy, expected_dx = np.gradient(data.astype(np.float64) * 1.5, 0.25)
+        np.testing.assert_allclose(result.dz_dx, expected_dx, rtol=1e-5, atol=1e-3)
+        np.testing.assert_allclose(result.dz_dy, expected_dy, rtol=1e-5, atol=1e-3)
+        np.testing.assert_allclose(
+            result.magnitude, np.hypot(expected_dx, expected_dy), rtol=1e-5, atol=1e-3
+        )
+
+    def test_gradient_numpy_fallback_matches_kernel(self) -> None:
+        """Test that the NumPy gradient path agrees with the compiled kernel."""
+        rng = np.random.default_rng(4)
+        data = rng.integers(0, 256, size=(9, 14), dtype=np.uint8)
+        outputs = [np.empty((3, 9, 14), dtype=np.float32) for _ in range(2)]
+        for func, out in zip((grad_fused, grad_fused_numpy), outputs):
+            func(data, 2.0, 0.5, out[0], out[1], out[2])
+        np.testing.assert_allclose(outputs[0], outputs[1], rtol=1e-5, atol=1e-4)
+
+    def test_gradient_strategy_outputs_float32(self) -> None:
+        """Test that all gradient outputs are single precision."""
+        result = self.gradient_strategy.analyze(self.data_2d)
+        self.assertEqual(result.dz_dx.dtype, np.float32)
+        self.assertEqual(result.dz_dy.dtype, np.float32)
+        assert result.magnitude is not None
+        self.assertEqual(result.magnitude.dtype, np.float32)
+
+    def test_gradient_strategy_outputs_aligned(self) -> None:
+        """Test that gradient outputs start on a 64-byte boundary."""
+        result = self.gradient_strategy.analyze(np.zeros((7, 5), dtype=np.uint8))
+        self.assertEqual(result.dz_dx.ctypes.data % 64, 0)
+        self.assertEqual(result.dz_dy.ctypes.data % 64, 0)
+        assert result.magnitude is not None
+        self.assertEqual(result.magnitude.ctypes.data % 64, 0)
+
     def test_gradient_strategy_with_invalid_data(self) -> None:
         """Test gradient strategy with invalid (non-2D) data."""
         with self.assertRaises(ValueError):
@@ -90,11 +136,54 @@ class TestAnalysisStrategies(unittest.TestCase):
         expected_volume = (1 + 2 + 3 + 4) * 2.5 * pixel_area
         self.assertAlmostEqual(result.volume, expected_volume)
 
+    def test_volume_strategy_large_uint8_region(self) -> None:
+        """Test that the uint8 height sum does not overflow on large regions."""
+        data = np.full((512, 512), 255, dtype=np.uint8)
+        result = self.volume_strategy.analyze(data, z_factor=0.5, pixels_per_meter=1.0)
+        self.assertAlmostEqual(result.volume, 512 * 512 * 255 * 0.5)
+
+    def test_volume_strategy_strided_region(self) -> None:
+        """Test the volume of a non-contiguous region sliced out of a frame."""
+        rng = np.random.default_rng(3)
+        frame = rng.integers(0, 256, size=(40, 60), dtype=np.uint8)
+        region = frame[5:35:2, 10:50]
+        result = self.volume_strategy.analyze(region)
+        self.assertAlmostEqual(result.volume, float(region.sum(dtype=np.uint64)))
+
     def test_volume_strategy_with_invalid_data(self) -> None:
         """Test volume strategy with invalid (non-2D) data."""
         with self.assertRaises(ValueError):
             self.volume_strategy.analyze(np.array([1, 2, 3]))
 
+    def test_volume_strategy_batch_matches_single(self) -> None:
+        """Test that batched volumes match frame-by-frame results."""
+        rng = np.random.default_rng(1)
+        frames = rng.integers(0, 256, size=(4, 31, 17), dtype=np.uint8)
+        kwargs = {"z_factor": 1.5, "pixels_per_meter": 2.0}
+        results = self.volume_strategy.analyze_batch(frames, **kwargs)
+        self.assertEqual(len(results), 4)
+        for frame, result in zip(frames, results):
+            expected = self.volume_strategy.analyze(frame, **kwargs)
+            self.assertAlmostEqual(result.volume, expected.volume)
+
+    def test_gradient_strategy_batch_matches_single(self) -> None:
+        """Test that batched gradients match frame-by-frame results."""
+        rng = np.random.default_rng(2)
+        frames = rng.integers(0, 256, size=(3, 12, 9), dtype=np.uint8)
+        results = self.gradient_strategy.analyze_batch(frames, z_factor=2.0)
+        self.assertEqual(len(results), 3)
+        for frame, result in zip(frames, results):
+            expected = self.gradient_strategy.analyze(frame, z_factor=2.0)
+            np.testing.assert_allclose(result.dz_dx, expected.dz_dx)
+            np.testing.assert_allclose(result.dz_dy, expected.dz_dy)
+
+    def test_batch_with_invalid_data(self) -> None:
+        """Test that batch analysis rejects non-3D data."""
+        with self.assertRaises(ValueError):
+            self.volume_strategy.analyze_batch(self.data_2d)
+        with self.assertRaises(ValueError):
+            self.gradient_strategy.analyze_batch(self.data_2d)
+
     def test_arc_length_strategy(self) -> None:
         """Test the arc length calculation."""
         strategy = ArcLengthStrategy()
@@ -121,6 +210,39 @@ class TestAnalysisStrategies(unittest.TestCase):
 
         self.assertAlmostEqual(result.length, expected_length)
 
+    def test_calculate_arc_length_matches_hypot(self) -> None:
+        """Test the arc length helper against a per-segment hypot sum."""
+        rng = np.random.default_rng(5)
+        points = rng.random((500, 2)) * 255
+        deltas = np.diff(points, axis=0) * (0.25, 0.5)
+        expected = np.hypot(deltas[:, 0], deltas[:, 1]).sum()
+        self.assertAlmostEqual(
+            calculate_arc_length(points, scale_x=0.25, scale_y=0.5), expected
+        )
+
+    def test_arc_length_numpy_fallback_matches_kernel(self) -> None:
+        """Test that the NumPy arc length path agrees with the compiled kernel."""
+        rng = np.random.default_rng(6)
+        points = rng.random((300, 2)) * 255
+        points.setflags(write=False)
+        self.assertAlmostEqual(
+            arc_length_kernel(points, 0.1, 0.3), arc_length_numpy(points, 0.1, 0.3)
+        )
+        self.assertAlmostEqual(
+            arc_length_kernel(points[::3], 2.0, 1.0),
+            arc_length_numpy(points[::3], 2.0, 1.0),
+        )
+
+    def test_calculate_arc_length_float32(self) -> None:
+        """Test that float32 points give the same length as float64 ones."""
+        rng = np.random.default_rng(7)
+        points = (rng.random((400, 2)) * 255).astype(np.float32)
+        self.assertAlmostEqual(
+            calculate_arc_length(points, scale_x=0.5, scale_y=0.25),
+            calculate_arc_length(points.astype(np.float64), scale_x=0.5, scale_y=0.25),
+            places=3,
+        )
+
     def test_arc_length_with_empty_data(self) -> None:
         """Test arc length with empty or single-point data."""
         with self.assertRaises(ValueError):
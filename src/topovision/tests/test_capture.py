@@ -7,11 +7,17 @@ import unittest
 from typing import Optional
 from unittest.mock import MagicMock, patch
 
+import cv2
 import numpy as np
 
+from topovision.capture.capture_module import MockCamera as SyntheticCamera
+from topovision.capture.capture_module import ThreadedOpenCVCamera
+from topovision.capture.preprocessing import GaussianBlurStrategy, benchmark_filter
 from topovision.core.interfaces import ICamera
 from topovision.core.models import FrameData
+from topovision.gui._kernels import resize_nearest, resize_nearest_numpy
 from topovision.gui.camera_controller import CameraController
+from topovision.gui.gui_module import MainWindow
 
 
 class MockCamera(ICamera):
@@ -108,6 +114,118 @@ class TestCameraController(unittest.TestCase):
         frame = self.controller.get_frame()
         self.assertIsNotNone(frame)
         self.assertIsInstance(frame, np.ndarray)  # Changed from FrameData to np.ndarray
+        assert frame is not None
+        self.assertFalse(frame.flags.writeable)
+
+    def test_get_frame_rate_limited(self) -> None:
+        """Test that rapid calls reuse the last frame instead of re-reading."""
+        controller = CameraController(
+            self.mock_camera, self.update_callback, min_frame_interval=60.0
+        )
+        controller.start()
+        time.sleep(0.1)
+        first = controller.get_frame()
+        self.assertIsNotNone(first)
+        with patch.object(self.mock_camera, "get_frame") as camera_get_frame:
+            self.assertIs(controller.get_frame(), first)
+            camera_get_frame.assert_not_called()
+
+    def test_get_frame_repeats_same_object(self) -> None:
+        """Test that an unchanged camera frame is returned as the same array."""
+        frame_data = FrameData(
+            image=np.zeros((4, 4, 3), dtype=np.uint8), timestamp=0.0, frame_number=1
+        )
+        controller = CameraController(
+            self.mock_camera, self.update_callback, min_frame_interval=0.0
+        )
+        controller.start()
+        with patch.object(self.mock_camera, "get_frame", return_value=frame_data):
+            first = controller.get_frame()
+            self.assertIs(controller.get_frame(), first)
+
+    def test_get_frame_applies_processor(self) -> None:
+        """Test that new frames go through the frame processor once."""
+        frame_data = FrameData(
+            image=np.zeros((4, 4, 3), dtype=np.uint8), timestamp=0.0, frame_number=1
+        )
+        processor = MagicMock(side_effect=lambda image: image + 1)
+        controller = CameraController(
+            self.mock_camera,
+            self.update_callback,
+            min_frame_interval=0.0,
+            frame_processor=processor,
+        )
+        controller.start()
+        with patch.object(self.mock_camera, "get_frame", return_value=frame_data):
+            frame = controller.get_frame()
+            self.assertIs(controller.get_frame(), frame)
+        processor.assert_called_once()
+        assert frame is not None
+        self.assertEqual(int(frame[0, 0, 0]), 1)
+        self.assertFalse(frame.flags.writeable)
+
+    def test_threaded_get_frame(self) -> None:
+        """Test that the threaded mode serves frames from the capture thread."""
+        controller = CameraController(
+            self.mock_camera, self.update_callback, threaded=True
+        )
+        controller.start()
+        try:
+            deadline = time.time() + 2.0
+            frame = controller.get_frame()
+            while frame is None and time.time() < deadline:
+                time.sleep(0.01)
+                frame = controller.get_frame()
+            self.assertIsNotNone(frame)
+            assert frame is not None
+            self.assertFalse(frame.flags.writeable)
+        finally:
+            controller.pause()
+        self.assertIsNone(controller._capture_thread)
+        self.assertIsNone(controller.get_frame())
+
+    def test_capture_suspended(self) -> None:
+        """Test that suspending capture stops the thread but not the camera."""
+        controller = CameraController(
+            self.mock_camera, self.update_callback, threaded=True
+        )
+        controller.start()
+        try:
+            controller.set_capture_suspended(True)
+            self.assertIsNone(controller._capture_thread)
+            self.assertTrue(controller.is_running)
+            self.assertIsNone(controller.get_frame())
+            controller.set_capture_suspended(False)
+            self.assertIsNotNone(controller._capture_thread)
+        finally:
+            controller.stop()
+
+    def test_capture_failure_is_reported(self) -> None:
+        """Test that a failing camera ends the thread and reports the error."""
+        errors: list = []
+        controller = CameraController(
+            self.mock_camera,
+            self.update_callback,
+            threaded=True,
+            error_callback=errors.append,
+        )
+        failure = RuntimeError("device lost")
+        with patch.object(self.mock_camera, "get_frame", side_effect=failure):
+            controller.start()
+            deadline = time.time() + 2.0
+            while controller._capture_thread is not None and time.time() < deadline:
+                time.sleep(0.01)
+        self.assertIsNone(controller._capture_thread)
+        self.assertEqual(errors, [failure])
+        self.assertIs(controller.capture_error, failure)
+
+        controller.pause()
+        controller.start()
+        try:
+            self.assertIsNotNone(controller._capture_thread)
+            self.assertIsNone(controller.capture_error)
+        finally:
+            controller.stop()
 
     def test_get_frame_when_paused(self) -> None:
         """Test that get_frame returns None when paused."""
@@ -130,5 +248,147 @@ class TestCameraController(unittest.TestCase):
             )
 
 
+class TestThreadedOpenCVCamera(unittest.TestCase):
+    """Tests the threaded OpenCV camera with a patched capture device."""
+
+    def _run_with_frame(self, camera: ThreadedOpenCVCamera) -> FrameData:
+        bgr = np.zeros((4, 6, 3), dtype=np.uint8)
+        bgr[..., 0] = 255  # Pure blue in BGR order
+        with patch("cv2.VideoCapture") as video_capture:
+            cap = video_capture.return_value
+            cap.isOpened.return_value = True
+            cap.read.return_value = (True, bgr)
+            camera.start()
+            try:
+                deadline = time.time() + 2.0
+                frame = camera.get_frame()
+                while frame is None and time.time() < deadline:
+                    time.sleep(0.01)
+                    frame = camera.get_frame()
+            finally:
+                camera.stop()
+        assert frame is not None
+        return frame
+
+    def test_rgb_frames(self) -> None:
+        """Test that frames are delivered in RGB order by default."""
+        frame = self._run_with_frame(ThreadedOpenCVCamera())
+        self.assertEqual(frame.image.shape, (4, 6, 3))
+        self.assertEqual(frame.image[0, 0, 2], 255)
+
+    def test_gray_frames(self) -> None:
+        """Test that the gray pixel format yields single-channel frames."""
+        frame = self._run_with_frame(ThreadedOpenCVCamera(pixel_format="gray"))
+        self.assertEqual(frame.image.shape, (4, 6))
+
+    def test_invalid_pixel_format(self) -> None:
+        """Test that an unknown pixel format is rejected."""
+        with self.assertRaises(ValueError):
+            ThreadedOpenCVCamera(pixel_format="yuv")
+
+
+class TestSyntheticCamera(unittest.TestCase):
+    """Tests the synthetic camera used when no device is available."""
+
+    def test_frames_rotate_through_buffers(self) -> None:
+        """Test that recent frames keep their own buffers until the ring wraps."""
+        camera = SyntheticCamera(width=60, height=40, pattern="gradient")
+        camera._frame_rate = 10_000
+        camera.start()
+        frames = [camera.get_frame() for _ in range(camera.FRAME_RING_SIZE + 1)]
+        images = [frame.image for frame in frames if frame is not None]
+        self.assertEqual(len(images), camera.FRAME_RING_SIZE + 1)
+        self.assertEqual(images[0].shape, (40, 60, 3))
+        self.assertFalse(images[0].flags.writeable)
+        for earlier in images[1 : camera.FRAME_RING_SIZE]:
+            self.assertFalse(np.shares_memory(images[0], earlier))
+        self.assertTrue(np.shares_memory(images[0], images[-1]))
+
+
+class TestBenchmarkFilter(unittest.TestCase):
+    """Tests the preprocessing benchmark helper."""
+
+    def test_warmup_and_runs(self) -> None:
+        """Test that warmup calls are made and timings are ordered."""
+        filter_fn = MagicMock(side_effect=lambda image: image)
+        image = np.zeros((8, 8, 3), dtype=np.uint8)
+        timings = benchmark_filter(filter_fn, image, runs=5, warmup=2)
+        self.assertEqual(filter_fn.call_count, 7)
+        self.assertLessEqual(timings["min_ms"], timings["p50_ms"])
+        self.assertLessEqual(timings["p50_ms"], timings["p99_ms"])
+
+    def test_with_real_filter(self) -> None:
+        """Test timing an actual preprocessing strategy."""
+        image = np.zeros((64, 64, 3), dtype=np.uint8)
+        timings = benchmark_filter(GaussianBlurStrategy().process, image, runs=3)
+        self.assertGreaterEqual(timings["min_ms"], 0.0)
+
+    def test_invalid_runs(self) -> None:
+        """Test that a non-positive run count is rejected."""
+        with self.assertRaises(ValueError):
+            benchmark_filter(lambda image: image, np.zeros((1, 1), np.uint8), runs=0)
+
+
+class TestPreviewKernels(unittest.TestCase):
+    """Tests the preview resize kernel."""
+
+    def test_resize_nearest_matches_cv2(self) -> None:
+        """Test the kernel and its fallback against cv2 nearest-neighbour resize."""
+        rng = np.random.default_rng(5)
+        frame = rng.integers(0, 256, size=(48, 64, 3), dtype=np.uint8)
+        for h, w in ((70, 90), (20, 30), (48, 64)):
+            expected = cv2.resize(frame, (w, h), interpolation=cv2.INTER_NEAREST)
+            for func in (resize_nearest, resize_nearest_numpy):
+                out = np.empty((h, w, 3), dtype=np.uint8)
+                func(frame, out)
+                np.testing.assert_array_equal(out, expected)
+
+
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestPreviewCanvas(unittest.TestCase):
+    """Tests the colour handling of the live preview."""
+
+    def setUp(self) -> None:
+        self.window = MainWindow.__new__(MainWindow)
+        self.window.canvas = MagicMock()
+        self.window.photo = None
+        self.window._photo_size = None
+        self.window._rgb_buf = None
+        self.window._ppm_buf = None
+        self.window._resized_buf = None
+        self.window.preview_interpolation = cv2.INTER_NEAREST
+        self.window._schedule_refresh = MagicMock()  # type: ignore[method-assign]
+
+    def _render(self, frame: np.ndarray, size: tuple) -> np.ndarray:
+        """Pushes ``frame`` through the preview and returns the PPM pixels."""
+        self.window.canvas.canvas_size = size
+        self.window.photo = None
+        with patch("topovision.gui.gui_module.tk.PhotoImage") as photo_image:
+            self.window._update_canvas_image(frame)
+        data = photo_image.call_args.kwargs["data"]
+        w, h = size
+        return np.frombuffer(data[-w * h * 3 :], dtype=np.uint8).reshape(h, w, 3)
+
+    def test_rgb_frames_keep_channel_order(self) -> None:
+        """Test that RGB frames reach the PPM data unswapped."""
+        frame = np.empty((4, 6, 3), dtype=np.uint8)
+        frame[:] = (10, 20, 30)
+        for size in ((6, 4), (12, 8)):
+            pixels = self._render(frame, size)
+            np.testing.assert_array_equal(
+                pixels, np.broadcast_to(frame[0, 0], pixels.shape)
+            )
+        # RGB frames are resized straight into the PPM payload.
+        self.assertIsNone(self.window._resized_buf)
+
+    def test_rgba_and_gray_frames(self) -> None:
+        """Test that RGBA drops its alpha and greyscale is replicated."""
+        rgba = np.empty((4, 6, 4), dtype=np.uint8)
+        rgba[:] = (10, 20, 30, 40)
+        gray = np.full((4, 6), 50, dtype=np.uint8)
+        for size in ((6, 4), (12, 8)):
+            np.testing.assert_array_equal(self._render(rgba, size)[0, 0], (10, 20, 30))
+            np.testing.assert_array_equal(self._render(gray, size)[0, 0], (50, 50, 50))
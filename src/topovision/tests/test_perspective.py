@@ -0,0 +1,132 @@
+import unittest
+
+import cv2
+import numpy as np
+
+from topovision.utils.perspective import PerspectiveCorrector
+
+SRC_QUAD = [(40, 30), (280, 50), (300, 220), (20, 200)]
+
+
+def _smooth_image(height: int, width: int) -> np.ndarray:
+    """A low-frequency test pattern, so interpolation rounding stays small."""
+    ys, xs = np.mgrid[0:height, 0:width].astype(np.float64)
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    image[..., 0] = 127.5 + 127.5 * np.sin(xs / 17.0)
+    image[..., 1] = 127.5 + 127.5 * np.cos(ys / 23.0)
+    image[..., 2] = 127.5 + 127.5 * np.sin((xs + ys) / 29.0)
+    return image
+
+
+class TestPerspectiveWarp(unittest.TestCase):
+    """Test suite for the CPU perspective warp."""
+
+    def setUp(self) -> None:
+        """Set up a corrector that always takes the CPU path."""
+        self.corrector = PerspectiveCorrector(SRC_QUAD, 0.4, 0.3)
+        self.corrector._use_cuda = False
+        self.image = _smooth_image(240, 320)
+
+    def _assert_close_to_warp_perspective(self, warped: np.ndarray) -> None:
+        expected = cv2.warpPerspective(
+            self.image,
+            self.corrector.matrix,
+            (self.corrector.dst_width_px, self.corrector.dst_height_px),
+            flags=cv2.INTER_LINEAR,
+        )
+        diff = np.abs(warped.astype(np.int16) - expected.astype(np.int16))
+        self.assertEqual(warped.shape, expected.shape)
+        self.assertLessEqual(int(diff.max()), 4)
+        self.assertLess(float(diff.mean()), 0.5)
+
+    def test_warp_image_matches_warp_perspective(self) -> None:
+        """Test the fixed-point remap against cv2.warpPerspective."""
+        self._assert_close_to_warp_perspective(self.corrector.warp_image(self.image))
+
+    def test_remap_maps_rebuilt_on_geometry_change(self) -> None:
+        """Test that the cached maps follow changes to the matrix and size."""
+        self.corrector.warp_image(self.image)
+        first_maps = self.corrector._remap_maps()
+        self.assertIs(self.corrector._remap_maps(), first_maps)
+
+        other = PerspectiveCorrector([(10, 10), (300, 20), (310, 230), (0, 210)], 1, 1)
+        self.corrector.matrix = other.matrix
+        self.corrector.inverse_matrix = other.inverse_matrix
+        warped = self.corrector.warp_image(self.image)
+        self.assertIsNot(self.corrector._remap_maps(), first_maps)
+        self._assert_close_to_warp_perspective(warped)
+
+        self.corrector.dst_width_px, self.corrector.dst_height_px = 200, 150
+        warped = self.corrector.warp_image(self.image)
+        self.assertEqual(warped.shape, (150, 200, 3))
+        self._assert_close_to_warp_perspective(warped)
+
+    def test_warp_image_into_out(self) -> None:
+        """Test writing into a caller buffer and rejecting mismatched ones."""
+        size = (self.corrector.dst_height_px, self.corrector.dst_width_px)
+        out = np.empty(size + (3,), dtype=np.uint8)
+        self.assertIs(self.corrector.warp_image(self.image, out=out), out)
+        np.testing.assert_array_equal(out, self.corrector.warp_image(self.image))
+        for bad_out in (
+            np.empty(size, dtype=np.uint8),
+            np.empty((size[0] - 1, size[1], 3), dtype=np.uint8),
+            np.empty(size + (3,), dtype=np.float32),
+        ):
+            with self.assertRaises(ValueError):
+                self.corrector.warp_image(self.image, out=bad_out)
+
+    def test_warp_batch_matches_single(self) -> None:
+        """Test that batched warps match frame-by-frame results."""
+        frames = np.stack([self.image, self.image[::-1], self.image[:, ::-1]])
+        for stack in (frames, frames[..., 0]):
+            warped = self.corrector.warp_batch(stack)
+            self.assertEqual(len(warped), 3)
+            for frame, result in zip(stack, warped):
+                np.testing.assert_array_equal(result, self.corrector.warp_image(frame))
+        with self.assertRaises(ValueError):
+            self.corrector.warp_batch(self.image[..., 0])
+
+
+class TestPerspectivePoints(unittest.TestCase):
+    """Test suite for the point transforms."""
+
+    def setUp(self) -> None:
+        """Set up the test case."""
+        self.corrector = PerspectiveCorrector(SRC_QUAD, 0.4, 0.3)
+
+    def test_transform_points_matches_opencv(self) -> None:
+        """Test the batched transform against cv2.perspectiveTransform."""
+        rng = np.random.default_rng(8)
+        points = rng.random((50, 2)) * (320, 240)
+        expected = cv2.perspectiveTransform(
+            points.reshape(-1, 1, 2), self.corrector.matrix
+        ).reshape(-1, 2)
+        result = self.corrector.transform_points(points)
+        self.assertEqual(result.shape, (50, 2))
+        np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-6)
+        np.testing.assert_allclose(
+            self.corrector.transform_points(SRC_QUAD),
+            self.corrector.dst_points,
+            atol=1e-6,
+        )
+        np.testing.assert_allclose(
+            result[3], self.corrector.transform_point(tuple(points[3])), rtol=1e-12
+        )
+
+    def test_transform_points_inv_round_trip(self) -> None:
+        """Test that the inverse transform undoes the forward one."""
+        rng = np.random.default_rng(9)
+        points = rng.random((50, 2)) * (320, 240)
+        top_down = self.corrector.transform_points(points)
+        np.testing.assert_allclose(
+            self.corrector.transform_points_inv(top_down), points, atol=1e-6
+        )
+        np.testing.assert_allclose(
+            self.corrector.transform_points_inv(self.corrector.dst_points),
+            SRC_QUAD,
+            atol=1e-6,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
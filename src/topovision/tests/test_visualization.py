@@ -87,3 +87,43 @@ class TestHeatmapVisualizer(unittest.TestCase):
         vis_array = np.array(visualization)
         orig_array = np.array(self.original_image)
         self.assertFalse(np.array_equal(vis_array, orig_array))
+
+    def test_render_returns_array_without_modifying_original(self) -> None:
+        """Test the array path of the visualizer."""
+        original = np.zeros((100, 100, 3), dtype=np.uint8)
+        original.flags.writeable = False
+        rendered = self.visualizer.render(self.analysis_result, original)
+        self.assertIsInstance(rendered, np.ndarray)
+        self.assertEqual(rendered.shape, original.shape)
+        self.assertEqual(rendered.dtype, np.uint8)
+        self.assertFalse(original.any())
+        self.assertTrue(rendered[10:90, 10:90].any())
+        self.assertFalse(rendered[:10].any())
+
+    def test_render_region_outside_frame(self) -> None:
+        """Test that a selection entirely outside the frame draws nothing."""
+        original = np.zeros((48, 64, 3), dtype=np.uint8)
+        analysis_result = AnalysisResult(
+            method="gradient",
+            result_data=self.analysis_result.result_data,
+            region=RegionOfInterest(x1=70, y1=50, x2=80, y2=56),
+        )
+        rendered = self.visualizer.render(analysis_result, original)
+        self.assertEqual(rendered.shape, original.shape)
+        self.assertFalse(rendered.any())
+
+    def test_render_region_partly_outside_frame(self) -> None:
+        """Test that a clipped selection crops the heatmap instead of squashing it."""
+        analysis_result = AnalysisResult(
+            method="gradient",
+            result_data=self.analysis_result.result_data,
+            region=RegionOfInterest(x1=60, y1=70, x2=140, y2=150),
+        )
+        clipped = self.visualizer.render(
+            analysis_result, np.zeros((100, 100, 3), dtype=np.uint8)
+        )
+        full = self.visualizer.render(
+            analysis_result, np.zeros((200, 200, 3), dtype=np.uint8)
+        )
+        np.testing.assert_array_equal(clipped, full[:100, :100])
+        self.assertTrue(clipped[70:, 60:].any())
@@ -9,8 +9,9 @@ Modules:
 - `units`: Provides a `UnitConverter` class for converting between different
            units of measurement.
 - `perspective`: Provides a `PerspectiveCorrector` for handling perspective distortion.
+- `cuda`: Detects whether OpenCV can use a CUDA device.
 """
 
-from . import math, perspective, units
+from . import cuda, math, perspective, units
 
-__all__ = ["math", "units", "perspective"]
+__all__ = ["math", "units", "perspective", "cuda"]
@@ -0,0 +1,20 @@
+"""
+Detection of OpenCV's optional CUDA support.
+
+Both the preprocessing filters and the perspective warps switch to their GPU
+paths based on :data:`CUDA_AVAILABLE`, so the device is probed once here
+instead of in either of those layers.
+"""
+
+import cv2
+
+
+def _cuda_device_available() -> bool:
+    """Returns True if OpenCV was built with CUDA and a device is present."""
+    try:
+        return bool(cv2.cuda.getCudaEnabledDeviceCount() > 0)
+    except (AttributeError, cv2.error):
+        return False
+
+
+CUDA_AVAILABLE = _cuda_device_available()
@@ -1,16 +1,29 @@
 """
 This module provides utility functions for mathematical calculations,
-optimized for performance using NumPy.
+optimized for performance using NumPy, and Numba when it is installed.
+
+Numba is only imported, and the kernel compiled, on the first arc length
+calculation (or by :func:`compile_kernels`), so importing ``topovision.utils``
+stays cheap.
 """
 
-from typing import List, Tuple, Union
+import importlib.util
+import math
+from functools import lru_cache
+from typing import Any, Callable, List, Tuple, Union, cast
 
 import numpy as np
 from numpy.typing import NDArray
 
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+# Point dtypes the arc length is computed in directly, without a copy
+_NATIVE_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
 
 def calculate_arc_length(
-    points: Union[NDArray[np.float64], List[Tuple[float, float]]],
+    points: Union[NDArray[Any], List[Tuple[float, float]]],
     scale_x: float,
     scale_y: float,
 ) -> float:
@@ -20,13 +33,19 @@ def calculate_arc_length(
 
     Args:
         points: A NumPy array of shape (N, 2) or a list of (x, y) tuples.
+            float32 and float64 arrays are used as-is; anything else is
+            converted to float64.
         scale_x (float): The conversion factor for the x-axis (e.g., meters/pixel).
         scale_y (float): The conversion factor for the y-axis (e.g., meters/pixel).
 
     Returns:
         The total length of the curve in real-world units.
     """
-    points_arr = np.asarray(points, dtype=np.float64)
+    points_arr: NDArray[np.floating[Any]]
+    if isinstance(points, np.ndarray) and points.dtype in _NATIVE_DTYPES:
+        points_arr = points
+    else:
+        points_arr = np.asarray(points, dtype=np.float64)
 
     if points_arr.ndim != 2 or points_arr.shape[1] != 2:
         raise ValueError("Input `points` must be a 2D array or a list of 2D tuples.")
@@ -34,18 +53,80 @@ def calculate_arc_length(
     if len(points_arr) < 2:
         return 0.0
 
-    # Apply scaling to the points
-    scaled_points = np.copy(points_arr)
-    scaled_points[:, 0] *= scale_x  # Scale x-coordinates
-    scaled_points[:, 1] *= scale_y  # Scale y-coordinates (height)
+    return float(arc_length_kernel(points_arr, float(scale_x), float(scale_y)))
+
 
-    # Calculate the differences between consecutive points (dx, dy)
-    deltas = np.diff(scaled_points, axis=0)
+def arc_length_numpy(
+    points: NDArray[np.floating[Any]], scale_x: float, scale_y: float
+) -> float:
+    """NumPy implementation of :func:`arc_length_kernel`, used without Numba."""
+    # Work on separate contiguous dx / dy arrays rather than the strided
+    # columns of an (N-1, 2) delta array, updating them in place so the only
+    # temporaries are these two. sqrt(dx² + dy²) replaces np.hypot, whose
+    # overflow-safe scaling costs several times more and is not needed for
+    # pixel-scale coordinates.
+    dx = np.subtract(points[1:, 0], points[:-1, 0])
+    dy = np.subtract(points[1:, 1], points[:-1, 1])
+    dx *= scale_x  # Scale x-coordinates
+    dy *= scale_y  # Scale y-coordinates (height)
+    dx *= dx
+    dy *= dy
+    dx += dy
+    # Euclidean length of each segment, summed over the path
+    return float(np.sqrt(dx, out=dx).sum(dtype=np.float64))
 
-    # Calculate the Euclidean distance for each 3D segment
-    segment_lengths = np.hypot(deltas[:, 0], deltas[:, 1])
 
-    # Sum the lengths of all segments
-    total_length = np.sum(segment_lengths)
+def _arc_length_loop(
+    points: NDArray[np.floating[Any]], scale_x: float, scale_y: float
+) -> float:
+    """Python source of the compiled arc length kernel."""
+    total = 0.0
+    for i in range(1, points.shape[0]):
+        dx = (points[i, 0] - points[i - 1, 0]) * scale_x
+        dy = (points[i, 1] - points[i - 1, 1]) * scale_y
+        total += math.sqrt(dx * dx + dy * dy)
+    return total
+
+
+@lru_cache(maxsize=None)
+def _compiled_arc_length() -> Callable[..., float]:
+    """
+    Returns the Numba arc length kernel, compiling it (or loading it from
+    Numba's on-disk cache) on the first call, or the NumPy fallback.
+    """
+    if not NUMBA_AVAILABLE:  # pragma: no cover - depends on the installed extras
+        return arc_length_numpy
+
+    from numba import njit, types
+
+    # Declared read-only so frozen arrays are accepted; writable ones convert.
+    signatures = [
+        types.float64(
+            types.Array(dtype, 2, "A", readonly=True), types.float64, types.float64
+        )
+        for dtype in (types.float32, types.float64)
+    ]
+    return cast(
+        Callable[..., float],
+        njit(signatures, fastmath=True, cache=True)(_arc_length_loop),
+    )
+
+
+def arc_length_kernel(
+    points: NDArray[np.floating[Any]], scale_x: float, scale_y: float
+) -> float:
+    """
+    Sums the scaled segment lengths of an (N, 2) polyline in one pass.
+
+    Points are read in their own precision (float32 or float64) and the
+    segments are accumulated in float64.
+
+    No intermediate arrays are created, which matters for the short paths
+    the GUI measures, where NumPy's per-call overhead dominates.
+    """
+    return _compiled_arc_length()(points, scale_x, scale_y)
+
 
-    return float(total_length)
+def compile_kernels() -> None:
+    """Builds the arc length kernel ahead of the first calculation."""
+    _compiled_arc_length()
@@ -2,11 +2,66 @@
 A module for handling perspective correction in TopoVision.
 """
 
-from typing import List, Tuple, cast
+from typing import Any, List, Optional, Tuple, cast
 
 import cv2
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
+
+from topovision.utils.cuda import CUDA_AVAILABLE
+
+
+def _normalize_homography(matrix: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Scales a homography to unit Frobenius norm with its largest entry positive.
+
+    Homographies are only defined up to scale. Dividing by h22 instead would
+    blow up exactly for the quads where that entry approaches zero.
+    """
+    flat = matrix.ravel()
+    scale = np.linalg.norm(flat) * np.sign(flat[np.argmax(np.abs(flat))])
+    return cast(NDArray[np.float64], matrix / scale)
+
+
+def _homography(
+    src: NDArray[np.float64], dst: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """
+    Solves the 3x3 homography mapping four ``src`` points onto ``dst``.
+
+    The eight point correspondences give the usual 8x9 direct linear
+    transform system; its null vector, taken from the SVD in float64, holds
+    the matrix entries. Unlike a plain 8x8 solve with h22 fixed to 1, this
+    stays well-defined for quads where that entry approaches zero.
+    """
+    x, y = src[:, 0], src[:, 1]
+    u, v = dst[:, 0], dst[:, 1]
+    zeros, ones = np.zeros(4), np.ones(4)
+    system = np.empty((8, 9), dtype=np.float64)
+    system[0::2] = np.column_stack(
+        (x, y, ones, zeros, zeros, zeros, -u * x, -u * y, -u)
+    )
+    system[1::2] = np.column_stack(
+        (zeros, zeros, zeros, x, y, ones, -v * x, -v * y, -v)
+    )
+    matrix = np.linalg.svd(system)[2][-1].reshape(3, 3)
+    return _normalize_homography(matrix)
+
+
+def _apply_homography(
+    matrix_t: NDArray[np.float64], points: ArrayLike
+) -> NDArray[np.float64]:
+    """
+    Maps (N, 2) points through a homography given as its transpose, with one
+    matrix product and a broadcast divide by the projective coordinate.
+    """
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    homog = np.empty((pts.shape[0], 3), dtype=np.float64)
+    homog[:, :2] = pts
+    homog[:, 2] = 1.0
+    projected = homog @ matrix_t
+    projected[:, :2] /= projected[:, 2:3]
+    return projected[:, :2]
 
 
 class PerspectiveCorrector:
@@ -34,7 +89,7 @@ class PerspectiveCorrector:
         if real_width <= 0 or real_height <= 0:
             raise ValueError("Real-world dimensions must be positive.")
 
-        self.src_points: NDArray[np.float32] = np.array(src_points, dtype=np.float32)
+        self.src_points: NDArray[np.float64] = np.array(src_points, dtype=np.float64)
         self.real_width = real_width
         self.real_height = real_height
 
@@ -48,58 +103,197 @@ class PerspectiveCorrector:
             self.dst_height_px = 1000
             self.dst_width_px = int(1000 * real_width / real_height)
 
-        self.dst_points: NDArray[np.float32] = np.array(
+        self.dst_points: NDArray[np.float64] = np.array(
             [
                 [0, 0],
                 [self.dst_width_px - 1, 0],
                 [self.dst_width_px - 1, self.dst_height_px - 1],
                 [0, self.dst_height_px - 1],
             ],
-            dtype=np.float32,
+            dtype=np.float64,
         )
 
         # The scale of the orthographic (top-down) view
         self.pixels_per_meter = self.dst_width_px / self.real_width
 
-        # Compute the perspective transformation matrix
-        self.matrix: NDArray[np.float32] = cast(
-            NDArray[np.float32],
-            cv2.getPerspectiveTransform(self.src_points, self.dst_points),
-        )
-        self.inverse_matrix: NDArray[np.float32] = cast(
-            NDArray[np.float32],
-            cv2.getPerspectiveTransform(self.dst_points, self.src_points),
+        # Compute the perspective transformation matrix. Everything stays in
+        # float64, the precision OpenCV's warps and transforms take matrices in.
+        self.matrix: NDArray[np.float64] = _homography(self.src_points, self.dst_points)
+        # Inverting the 3x3 result is far cheaper than a second DLT solve
+        self.inverse_matrix: NDArray[np.float64] = _normalize_homography(
+            np.linalg.inv(self.matrix)
         )
+        # Transposed copies for the row-vector products in transform_points
+        # and transform_points_inv
+        self._matrix_t = np.ascontiguousarray(self.matrix.T)
+        self._inverse_matrix_t = np.ascontiguousarray(self.inverse_matrix.T)
+
+        # Warps run on the GPU when OpenCV has a CUDA device. The stream and
+        # upload buffer are created on first use and reused for every frame.
+        self._use_cuda = CUDA_AVAILABLE
+        self._gpu_src: Any = None
+        self._gpu_dst: Any = None
+        self._gpu_stream: Any = None
+        # Fixed-point source coordinates of every output pixel, built on the
+        # first CPU warp and keyed on the geometry they were built for (see
+        # _remap_maps)
+        self._maps: Optional[Tuple[NDArray[np.int16], NDArray[np.uint16]]] = None
+        self._maps_key: Optional[Tuple[bytes, int, int]] = None
 
     def transform_point(self, point: Tuple[float, float]) -> Tuple[float, float]:
         """
         Transforms a single point from image perspective to top-down view.
 
+        The homography is applied with plain float arithmetic; for one point
+        this is far cheaper than building an array for cv2.perspectiveTransform.
+
         Args:
             point (Tuple[float, float]): The (x, y) coordinate in the image.
 
         Returns:
             Tuple[float, float]: The corrected (x, y) coordinate in the top-down view.
         """
-        point_np: NDArray[np.float32] = np.array([[point]], dtype=np.float32)
-        transformed_point = cv2.perspectiveTransform(point_np, self.matrix)
-        # The output of perspectiveTransform is an array of shape (1, 1, 2)
-        return (float(transformed_point[0][0][0]), float(transformed_point[0][0][1]))
+        x, y = float(point[0]), float(point[1])
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = self.matrix.tolist()
+        den = m20 * x + m21 * y + m22
+        return ((m00 * x + m01 * y + m02) / den, (m10 * x + m11 * y + m12) / den)
+
+    def transform_points(self, points: ArrayLike) -> NDArray[np.float64]:
+        """
+        Transforms many points from image perspective to top-down view at once.
+
+        Args:
+            points (ArrayLike): An (N, 2) array of (x, y) image coordinates.
+
+        Returns:
+            NDArray[np.float64]: The (N, 2) corrected coordinates.
+        """
+        return _apply_homography(self._matrix_t, points)
 
-    def warp_image(self, image: NDArray[np.uint8]) -> NDArray[np.uint8]:
+    def transform_points_inv(self, points: ArrayLike) -> NDArray[np.float64]:
+        """
+        Maps many points from the top-down view back to image perspective.
+
+        Args:
+            points (ArrayLike): An (N, 2) array of (x, y) top-down coordinates.
+
+        Returns:
+            NDArray[np.float64]: The (N, 2) coordinates in the image.
+        """
+        return _apply_homography(self._inverse_matrix_t, points)
+
+    def warp_image(
+        self, image: NDArray[np.uint8], out: Optional[NDArray[np.uint8]] = None
+    ) -> NDArray[np.uint8]:
         """
         Applies the perspective warp to an entire image.
 
         Args:
             image (NDArray[np.uint8]): The source image.
+            out (Optional[NDArray[np.uint8]]): Array to write the result into,
+                so a video loop can reuse one buffer instead of allocating a
+                new top-down image per frame. It must have the output size,
+                the channels of ``image`` and its dtype.
 
         Returns:
-            NDArray[np.uint8]: The resulting top-down image.
+            NDArray[np.uint8]: The resulting top-down image (``out`` if given).
         """
-        # cv2.warpPerspective should return the same dtype as the input image
+        if out is not None:
+            expected = (self.dst_height_px, self.dst_width_px) + image.shape[2:]
+            if out.shape != expected or out.dtype != image.dtype:
+                raise ValueError(
+                    f"out must be a {expected} {image.dtype} array, got "
+                    f"{out.shape} {out.dtype}."
+                )
+        if self._use_cuda and image.dtype == np.uint8 and image.ndim in (2, 3):
+            return self._warp_cuda(image, out)
+        # The geometry never changes, so the per-pixel homography is solved
+        # once and every warp is a plain remap (gather + bilinear blend).
+        map1, map2 = self._remap_maps()
         return cast(
             NDArray[np.uint8],
-            cv2.warpPerspective(
-                image, self.matrix, (self.dst_width_px, self.dst_height_px)
-            ),
+            cv2.remap(image, map1, map2, cv2.INTER_LINEAR, dst=out),
         )
+
+    def warp_batch(self, frames: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        """
+        Applies the perspective warp to every frame of an ``(N, H, W)`` or
+        ``(N, H, W, C)`` stack.
+
+        The output stack is allocated once and each frame is warped straight
+        into its slot with the shared remap tables (or GPU buffers), so a
+        batch costs one allocation instead of one per frame.
+
+        Args:
+            frames (NDArray[np.uint8]): The source frames.
+
+        Returns:
+            NDArray[np.uint8]: The ``(N, dst_height_px, dst_width_px[, C])``
+            top-down frames.
+        """
+        if frames.ndim not in (3, 4):
+            raise ValueError("PerspectiveCorrector.warp_batch expects 3D or 4D data.")
+
+        warped = np.empty(
+            (frames.shape[0], self.dst_height_px, self.dst_width_px) + frames.shape[3:],
+            dtype=frames.dtype,
+        )
+        for frame, out in zip(frames, warped):
+            self.warp_image(frame, out)
+        return warped
+
+    def _remap_maps(self) -> Tuple[NDArray[np.int16], NDArray[np.uint16]]:
+        """
+        Returns the inverse warp maps in OpenCV's fixed-point format, building
+        them on first use and again whenever ``inverse_matrix`` or the output
+        size has changed since.
+
+        Each output pixel is mapped through the inverse homography to its
+        source position, then converted with cv2.convertMaps into an integer
+        map and an interpolation-table index, which cv2.remap reads faster
+        than float coordinates.
+        """
+        key = (self.inverse_matrix.tobytes(), self.dst_width_px, self.dst_height_px)
+        if self._maps is None or key != self._maps_key:
+            (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = (
+                self.inverse_matrix.tolist()
+            )
+            xs = np.arange(self.dst_width_px, dtype=np.float64)[np.newaxis, :]
+            ys = np.arange(self.dst_height_px, dtype=np.float64)[:, np.newaxis]
+            inv_den = 1.0 / (m20 * xs + m21 * ys + m22)
+            map_x = ((m00 * xs + m01 * ys + m02) * inv_den).astype(np.float32)
+            map_y = ((m10 * xs + m11 * ys + m12) * inv_den).astype(np.float32)
+            self._maps = cast(
+                Tuple[NDArray[np.int16], NDArray[np.uint16]],
+                cv2.convertMaps(map_x, map_y, cv2.CV_16SC2),
+            )
+            self._maps_key = key
+        return self._maps
+
+    def _warp_cuda(
+        self, image: NDArray[np.uint8], out: Optional[NDArray[np.uint8]]
+    ) -> NDArray[np.uint8]:
+        """Applies the perspective warp on the GPU using persistent buffers."""
+        # The OpenCV stubs only cover part of the CUDA module.
+        cuda = cast(Any, cv2.cuda)
+        if self._gpu_stream is None:
+            self._gpu_stream = cv2.cuda.Stream()
+            self._gpu_src = cv2.cuda.GpuMat()
+            self._gpu_dst = cv2.cuda.GpuMat()
+        stream = self._gpu_stream
+
+        self._gpu_src.upload(image, stream)
+        cuda.warpPerspective(
+            self._gpu_src,
+            self.matrix,
+            (self.dst_width_px, self.dst_height_px),
+            self._gpu_dst,
+            flags=cv2.INTER_LINEAR,
+            stream=stream,
+        )
+        if out is None:
+            result = self._gpu_dst.download(stream=stream)
+        else:
+            result = self._gpu_dst.download(stream, out)
+        stream.waitForCompletion()
+        return cast(NDArray[np.uint8], result)
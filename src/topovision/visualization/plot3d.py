@@ -1,4 +1,6 @@
-from typing import Optional, cast  # Import cast
+import time
+from functools import lru_cache
+from typing import Any, Optional, cast  # Import cast
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -9,10 +11,97 @@ from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 from numpy.typing import NDArray
 
 
+@lru_cache(maxsize=8)
+def _cell_corner_index(rows: int, cols: int) -> NDArray[np.intp]:
+    """
+    Returns flat indices into a (rows, cols) grid listing the four corners
+    of every cell.
+
+    The order matches the quads ``plot_surface`` builds with strides of 1:
+    top-left, top-right, bottom-right, bottom-left, cells in row-major order.
+    """
+    starts = np.add.outer(np.arange(rows - 1) * cols, np.arange(cols - 1)).ravel()
+    corners = np.array([0, 1, cols + 1, cols])
+    index: NDArray[np.intp] = starts[:, np.newaxis] + corners
+    index.setflags(write=False)
+    return index
+
+
+def _surface_polygons(
+    x_data: NDArray[np.floating[Any]],
+    y_data: NDArray[np.floating[Any]],
+    z_data: NDArray[np.floating[Any]],
+) -> Optional[NDArray[np.float64]]:
+    """
+    Builds the (cells, 4, 3) quad array of a surface in one vectorized
+    gather.
+
+    Returns None if any point is non-finite, where ``plot_surface`` would
+    drop points and produce quads of uneven size.
+    """
+    index = _cell_corner_index(*z_data.shape)
+    polys: NDArray[np.float64] = np.stack(
+        [np.take(a, index) for a in (x_data, y_data, z_data)], axis=-1
+    ).astype(np.float64, copy=False)
+    if not np.isfinite(polys).all():
+        return None
+    return polys
+
+
+def _stride_index(size: int, stride: int) -> NDArray[np.intp]:
+    """
+    Returns every ``stride``-th index below ``size``, always ending on the
+    last one, the way ``plot_wireframe`` picks its lines.
+    """
+    index: NDArray[np.intp] = np.arange(0, size - 1 + stride, stride).clip(max=size - 1)
+    return index
+
+
+def _subsample_grid(
+    x_data: NDArray[np.floating[Any]],
+    y_data: NDArray[np.floating[Any]],
+    z_data: NDArray[np.floating[Any]],
+    rstride: int,
+    cstride: int,
+) -> tuple[
+    NDArray[np.floating[Any]], NDArray[np.floating[Any]], NDArray[np.floating[Any]]
+]:
+    """
+    Picks every ``rstride``-th row and ``cstride``-th column of the grids,
+    keeping the last row and column so the surface spans the same extent.
+
+    Plotting the result with strides of 1 draws one quad per sampled cell,
+    which ``plot_surface`` builds in a single vectorized pass and which
+    :func:`update_surface_plot_data` can always update in place. With
+    strides above 1, ``plot_surface`` would instead trace each patch's
+    full-resolution perimeter and fall back to a per-patch Python loop
+    whenever the strides do not divide the grid.
+    """
+    if rstride == 1 and cstride == 1:
+        return x_data, y_data, z_data
+    rows = _stride_index(z_data.shape[0], rstride)[:, np.newaxis]
+    cols = _stride_index(z_data.shape[1], cstride)
+    return x_data[rows, cols], y_data[rows, cols], z_data[rows, cols]
+
+
+def _wireframe_lines(
+    x_data: NDArray[np.floating[Any]],
+    y_data: NDArray[np.floating[Any]],
+    z_data: NDArray[np.floating[Any]],
+    rstride: int,
+    cstride: int,
+) -> list[NDArray[np.floating[Any]]]:
+    """Returns the row and column lines ``plot_wireframe`` draws for a grid."""
+    row_index = _stride_index(z_data.shape[0], rstride)
+    col_index = _stride_index(z_data.shape[1], cstride)
+    grid = np.stack((x_data, y_data, z_data), axis=-1)
+    return list(grid[row_index]) + list(grid[:, col_index].swapaxes(0, 1))
+
+
 def create_initial_surface_plot(
-    x_data: NDArray[np.float64],
-    y_data: NDArray[np.float64],
-    z_data: NDArray[np.float64],
+    x_data: NDArray[np.floating[Any]],
+    y_data: NDArray[np.floating[Any]],
+    z_data: NDArray[np.floating[Any]],
     title: str = "3D Surface Plot",
     xlabel: str = "X",
     ylabel: str = "Y",
@@ -35,14 +124,15 @@ def create_initial_surface_plot(
     fig: Figure = plt.figure(figsize=(10, 8))
     ax: Axes3D = fig.add_subplot(111, projection="3d")  # Explicitly type as Axes3D
 
+    x_grid, y_grid, z_grid = _subsample_grid(x_data, y_data, z_data, rstride, cstride)
     surface = ax.plot_surface(
-        x_data,
-        y_data,
-        z_data,
+        x_grid,
+        y_grid,
+        z_grid,
         cmap=cmap,
         shade=shade,
-        rstride=rstride,
-        cstride=cstride,
+        rstride=1,
+        cstride=1,
         alpha=0.9,
         antialiased=False,
     )
@@ -50,13 +140,13 @@ def create_initial_surface_plot(
     wireframe_obj: Optional[LineCollection] = None
     if wireframe:
         wireframe_obj = ax.plot_wireframe(
-            x_data,
-            y_data,
-            z_data,
+            x_grid,
+            y_grid,
+            z_grid,
             color="black",
             linewidth=0.5,
-            rstride=rstride * 2,
-            cstride=cstride * 2,
+            rstride=2,
+            cstride=2,
             alpha=0.3,
         )
 
@@ -81,9 +171,9 @@ def create_initial_surface_plot(
 
 def update_surface_plot_data(
     ax: Axes3D,  # Changed to Axes3D
-    x_data: NDArray[np.float64],
-    y_data: NDArray[np.float64],
-    z_data: NDArray[np.float64],
+    x_data: NDArray[np.floating[Any]],
+    y_data: NDArray[np.floating[Any]],
+    z_data: NDArray[np.floating[Any]],
     current_surface_obj: Poly3DCollection,
     current_wireframe_obj: Optional[LineCollection],
     cmap: str = "viridis",
@@ -93,39 +183,72 @@ def update_surface_plot_data(
     cstride: int = 1,
 ) -> tuple[Poly3DCollection, Optional[LineCollection]]:
     """
-    Updates the 3D surface plot by removing the old surface/wireframe and
-    creating new ones.
+    Updates the 3D surface plot with new data.
+
+    The grids are subsampled by the strides up front (see _subsample_grid).
+    When the surface keeps its polygon layout, the existing collection is
+    updated in place: its vertices and face values are replaced from one
+    vectorized gather, skipping the artist teardown and the rebuild inside
+    ``plot_surface``. Otherwise the old surface is removed and a new one is
+    created. The wireframe is handled the same way.
     """
+    x_data, y_data, z_data = _subsample_grid(x_data, y_data, z_data, rstride, cstride)
+
+    polys = None
     if current_surface_obj:
-        current_surface_obj.remove()
-    if current_wireframe_obj:
-        current_wireframe_obj.remove()
-
-    new_surface = ax.plot_surface(
-        x_data,
-        y_data,
-        z_data,
-        cmap=cmap,
-        shade=shade,
-        rstride=rstride,
-        cstride=cstride,
-        alpha=0.9,
-        antialiased=False,
-    )
+        polys = _surface_polygons(x_data, y_data, z_data)
+        face_values = current_surface_obj.get_array()
+        if polys is None or face_values is None or face_values.size != len(polys):
+            polys = None
+            current_surface_obj.remove()
 
-    new_wireframe: Optional[LineCollection] = None
-    if wireframe:
-        new_wireframe = ax.plot_wireframe(
+    if polys is not None:
+        new_surface = current_surface_obj
+        face_values = polys[..., 2].mean(axis=-1)
+        new_surface.set_verts(polys)
+        new_surface.set_array(face_values)
+        if new_surface.get_cmap().name != cmap:
+            new_surface.set_cmap(cmap)
+        # Rescale the colors to the new heights without notifying listeners:
+        # like a rebuilt surface, this leaves the color bar of the initial
+        # plot as it is, and spares its ~3 ms relayout on every update.
+        with new_surface.norm.callbacks.blocked():
+            new_surface.norm.autoscale(face_values)
+        ax.auto_scale_xyz(x_data, y_data, z_data, had_data=True)
+    else:
+        new_surface = ax.plot_surface(
             x_data,
             y_data,
             z_data,
-            color="black",
-            linewidth=0.5,
-            rstride=rstride * 2,
-            cstride=cstride * 2,
-            alpha=0.3,
+            cmap=cmap,
+            shade=shade,
+            rstride=1,
+            cstride=1,
+            alpha=0.9,
+            antialiased=False,
         )
 
+    new_wireframe: Optional[LineCollection] = None
+    if wireframe and current_wireframe_obj:
+        current_wireframe_obj.set_segments(
+            _wireframe_lines(x_data, y_data, z_data, 2, 2)
+        )
+        new_wireframe = current_wireframe_obj
+    else:
+        if current_wireframe_obj:
+            current_wireframe_obj.remove()
+        if wireframe:
+            new_wireframe = ax.plot_wireframe(
+                x_data,
+                y_data,
+                z_data,
+                color="black",
+                linewidth=0.5,
+                rstride=2,
+                cstride=2,
+                alpha=0.3,
+            )
+
     return new_surface, new_wireframe
 
 
@@ -136,18 +259,44 @@ if __name__ == "__main__":
     ) -> NDArray[np.float64]:  # Added return type
         return cast(NDArray[np.float64], np.sin(np.sqrt(x**2 + y**2)))  # Added cast
 
-    x = np.linspace(-5, 5, 100)
-    y = np.linspace(-5, 5, 100)
+    # 101 samples so the stride of 5 divides the grid and the surface is
+    # updated in place
+    x = np.linspace(-5, 5, 101)
+    y = np.linspace(-5, 5, 101)
     X, Y = np.meshgrid(x, y)
     Z = f(X, Y)
 
     fig, ax, surface, wireframe_obj = create_initial_surface_plot(
         X, Y, Z, title="Live 3D Surface Plot", rstride=5, cstride=5, wireframe=True
     )
+    # Fixed limits keep the axes, ticks and color bar static, so they can be
+    # drawn once into a background that each frame is blitted onto.
+    ax.set_zlim(-2.0, 2.0)
     plt.show(block=False)
 
+    surface.set_visible(False)
+    if wireframe_obj:
+        wireframe_obj.set_visible(False)
+    fig.canvas.draw()
+    background = cast(Any, fig.canvas).copy_from_bbox(fig.bbox)
+    surface.set_visible(True)
+    if wireframe_obj:
+        wireframe_obj.set_visible(True)
+
+    # Frame buffers, filled in place every iteration
+    Y_shift = np.empty_like(Y)
+    tmp = np.empty_like(Y)
+    new_Z = np.empty_like(Y)
+    X_squared = np.square(X)
+
     for i in range(100):
-        new_Z = f(X, Y + i * 0.1) + np.sin(i * 0.5) * 0.5
+        # new_Z = f(X, Y + i * 0.1) + np.sin(i * 0.5) * 0.5, without temporaries
+        np.add(Y, i * 0.1, out=Y_shift)
+        np.multiply(Y_shift, Y_shift, out=tmp)
+        tmp += X_squared
+        np.sqrt(tmp, out=tmp)
+        np.sin(tmp, out=new_Z)
+        new_Z += np.sin(i * 0.5) * 0.5
         surface, wireframe_obj = update_surface_plot_data(
             ax,
             X,
@@ -161,6 +310,13 @@ if __name__ == "__main__":
             rstride=5,
             cstride=5,
         )
-        fig.canvas.draw_idle()
+        # Redraw only the changing artists over the saved background. They
+        # are projected by hand, as Axes3D.draw would do before drawing them.
+        cast(Any, fig.canvas).restore_region(background)
+        for artist in (surface, wireframe_obj):
+            if artist is not None:
+                cast(Any, artist).do_3d_projection()
+                ax.draw_artist(artist)
+        fig.canvas.blit(fig.bbox)
         fig.canvas.flush_events()
-        plt.pause(0.01)
+        time.sleep(0.01)
@@ -27,83 +27,107 @@ class HeatmapVisualizer:
         """
         Generates a heatmap visualization for the given analysis result.
         """
+        original = np.asarray(original_image)
+        rendered = self.render(analysis_result, original, inverse_matrix, src_quad)
+        if rendered is original:
+            return original_image
+        return cast(Image.Image, Image.fromarray(rendered))
+
+    def render(
+        self,
+        analysis_result: AnalysisResult,
+        original: NDArray[np.uint8],
+        inverse_matrix: Optional[NDArray[np.float64]] = None,
+        src_quad: Optional[NDArray[np.float32]] = None,
+    ) -> NDArray[np.uint8]:
+        """
+        Array counterpart of :meth:`visualize`.
+
+        Takes and returns (H, W, 3) uint8 arrays, so callers that already hold
+        the frame as an array never build a PIL image. ``original`` is never
+        modified; it is returned as-is when there is nothing to draw.
+        """
         if isinstance(analysis_result.result_data, GradientResult):
             return self._create_gradient_heatmap(
-                analysis_result, original_image, inverse_matrix, src_quad
+                analysis_result, original, inverse_matrix, src_quad
             )
-        return original_image
+        return original
 
     def _create_gradient_heatmap(
         self,
         analysis_result: AnalysisResult,
-        original_image: Image.Image,
+        original: NDArray[np.uint8],
         inverse_matrix: Optional[NDArray[np.float64]],
         src_quad: Optional[NDArray[np.float32]],
-    ) -> Image.Image:
+    ) -> NDArray[np.uint8]:
         """
         Creates a heatmap for a GradientResult, handling perspective correction.
         """
         if not isinstance(analysis_result.result_data, GradientResult):
-            return original_image
+            return original
 
         gradient_result = analysis_result.result_data
         magnitude = gradient_result.magnitude
         if magnitude is None:
-            return original_image
+            return original
 
-        # Normalize the magnitude to the 0-255 range
-        if np.max(magnitude) > 0:
-            norm_magnitude = (
-                (magnitude - np.min(magnitude))
-                / (np.max(magnitude) - np.min(magnitude))
-                * 255
-            ).astype(np.uint8)
-        else:
-            norm_magnitude = np.zeros_like(magnitude, dtype=np.uint8)
+        # Normalize the magnitude to the 0-255 range, writing uint8 directly.
+        # A constant magnitude (including all zeros) maps to a zero image.
+        norm_magnitude = np.empty(magnitude.shape, dtype=np.uint8)
+        cv2.normalize(
+            magnitude, norm_magnitude, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U
+        )
 
-        heatmap_color = cv2.applyColorMap(norm_magnitude, cv2.COLORMAP_JET)
+        # applyColorMap produces BGR. Swap the ROI-sized heatmap once so the
+        # full-size original can be blended in its native RGB order.
+        heatmap_color = cv2.cvtColor(
+            cv2.applyColorMap(norm_magnitude, cv2.COLORMAP_JET), cv2.COLOR_BGR2RGB
+        )
 
+        height, width = original.shape[:2]
         if inverse_matrix is not None and src_quad is not None:
-            # Warp the heatmap back to the original image's perspective
+            # Only the quad's bounding box can change, so the heatmap is warped
+            # straight into that box (the inverse matrix is shifted by its
+            # origin) and blended there, instead of across the full frame.
+            quad = src_quad.astype(np.int32)
+            x0, y0, box_w, box_h = cv2.boundingRect(quad)
+            x1, y1 = min(x0 + box_w, width), min(y0 + box_h, height)
+            x0, y0 = max(x0, 0), max(y0, 0)
+            final_image = original.copy()
+            if x1 <= x0 or y1 <= y0:
+                return final_image
+            shift = np.array([[1, 0, -x0], [0, 1, -y0], [0, 0, 1]], dtype=np.float64)
             warped_heatmap = cv2.warpPerspective(
-                heatmap_color,
-                inverse_matrix,
-                (original_image.width, original_image.height),
+                heatmap_color, shift @ inverse_matrix, (x1 - x0, y1 - y0)
             )
-            # Create a single-channel mask to blend only within the selected quad
-            mask = np.zeros(
-                (original_image.height, original_image.width), dtype=np.uint8
-            )
-            # Ensure src_quad is int32 for fillConvexPoly and color is a sequence
-            cv2.fillConvexPoly(
-                mask, src_quad.astype(np.int32), (255,)
-            )  # Changed 255 to (255,)
+            # Single-channel mask of the selected quad within the box
+            mask = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+            cv2.fillConvexPoly(mask, quad - (x0, y0), (255,))
 
-            # Blend using the mask
-            original_np = cv2.cvtColor(np.array(original_image), cv2.COLOR_RGB2BGR)
-            blended_np = np.where(
-                mask[:, :, None] > 0,  # Expand mask to 3 channels for comparison
-                cv2.addWeighted(original_np, 0.4, warped_heatmap, 0.6, 0),
-                original_np,
-            )
-            return cast(
-                Image.Image,
-                Image.fromarray(cv2.cvtColor(blended_np, cv2.COLOR_BGR2RGB)),
-            )
+            roi = final_image[y0:y1, x0:x1]
+            blended = cv2.addWeighted(roi, 0.4, warped_heatmap, 0.6, 0)
+            np.copyto(roi, blended, where=mask[:, :, np.newaxis] > 0)
+            return final_image
         else:
             # Original logic for rectangular selection without perspective
-            heatmap_pil = cast(
-                Image.Image,
-                Image.fromarray(cv2.cvtColor(heatmap_color, cv2.COLOR_BGR2RGB)),
-            )
             region = analysis_result.region
-            if heatmap_pil.size != (region.width, region.height):
-                heatmap_pil = heatmap_pil.resize((region.width, region.height))
-
-            original_crop = original_image.crop(
-                (region.x1, region.y1, region.x2, region.y2)
-            )
-            blended_image = Image.blend(original_crop, heatmap_pil, alpha=0.6)
-            final_image = original_image.copy()
-            final_image.paste(blended_image, (region.x1, region.y1))
+            final_image = original.copy()
+            # The selection comes from the canvas and may reach past the
+            # frame, so blend only the part of the region that overlaps it.
+            x0, y0 = max(region.x1, 0), max(region.y1, 0)
+            x1, y1 = min(region.x2, width), min(region.y2, height)
+            if x1 <= x0 or y1 <= y0:
+                return final_image
+            region_size = (region.width, region.height)
+            if heatmap_color.shape[1::-1] != region_size:
+                # Bilinear is plenty for a semi-transparent overlay.
+                heatmap_color = cv2.resize(
+                    heatmap_color, region_size, interpolation=cv2.INTER_LINEAR
+                )
+            heatmap_crop = heatmap_color[
+                y0 - region.y1 : y1 - region.y1, x0 - region.x1 : x1 - region.x1
+            ]
+            # Blend in place inside the copy, like Image.blend with alpha=0.6
+            roi = final_image[y0:y1, x0:x1]
+            cv2.addWeighted(roi, 0.4, heatmap_crop, 0.6, 0, dst=roi)
             return final_image